@@ -1,23 +1,152 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import os
+import queue
+import re
+import shelve
 import threading
+import time
+import unicodedata
 import tkinter as tk
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from googletrans import Translator
+import httpx
+import numpy as np
 import pyttsx3
 import speech_recognition as sr
 import pyaudio
 import logging
 
+# Google Cloud Speech is optional; without it we fall back to recognize_google
+try:
+    from google.cloud import speech
+except ImportError:
+    speech = None
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it we use HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Suppress comtypes verbose logging
+# Silence comtypes (used by pyttsx3 on Windows) entirely: disabled loggers bail out
+# before any level lookup or record creation. The WARNING level still covers
+# comtypes sub-loggers, which do not inherit the disabled flag.
+for comtypes_logger in ('comtypes', 'comtypes.gen'):
+    logging.getLogger(comtypes_logger).disabled = True
 logging.getLogger('comtypes').setLevel(logging.WARNING)
-logging.getLogger('comtypes.gen').setLevel(logging.WARNING)
 
 
-# --- Initialize Translator ---
-translator = Translator()
+# --- Initialize Translator (async HTTP client on a dedicated event loop) ---
+TRANSLATE_URL = 'https://translate.googleapis.com/translate_a/single'
+TRANSLATE_TIMEOUT = 5  # Seconds before a translation request is abandoned
+KEEPALIVE_INTERVAL = 30  # Seconds between requests that keep the connection warm
+translate_loop = asyncio.new_event_loop()
+translate_loop_thread = threading.Thread(target=translate_loop.run_forever, daemon=True)
+translate_loop_thread.start()
+http_client = None  # Created lazily on the translation loop
+
+def get_http_client():
+    global http_client
+    if http_client is None:
+        # Idle connections must outlive the heartbeat interval to stay warm
+        limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=KEEPALIVE_INTERVAL * 2)
+        # Connection options live on the transport; httpx ignores the client's once one is given
+        transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=1)
+        http_client = httpx.AsyncClient(timeout=TRANSLATE_TIMEOUT, transport=transport)
+    return http_client
+
+async def request_translation(text, dest):
+    params = {'client': 'gtx', 'sl': 'auto', 'tl': dest, 'dt': 't', 'q': text}
+    response = await get_http_client().get(TRANSLATE_URL, params=params)
+    response.raise_for_status()
+    segments = response.json()[0] or []
+    return ''.join(segment[0] for segment in segments if segment[0])
+
+def submit_translation(text, dest='en'):
+    return asyncio.run_coroutine_threadsafe(request_translation(text, dest), translate_loop)
+
+# --- Keep the TLS connection to Google Translate warm ---
+def keep_translation_connection_warm():
+    def _log_failure(future):
+        if future.exception() is not None:
+            logger.debug(f"Translation keep-alive failed: {future.exception()}")
+
+    submit_translation('hello', 'en').add_done_callback(_log_failure)
+    timer = threading.Timer(KEEPALIVE_INTERVAL, keep_translation_connection_warm)
+    timer.daemon = True
+    timer.start()
+
+def close_http_client():
+    if http_client is not None:
+        future = asyncio.run_coroutine_threadsafe(http_client.aclose(), translate_loop)
+        future.result(timeout=1)
+    translate_loop.call_soon_threadsafe(translate_loop.stop)
+
+atexit.register(close_http_client)
+
+# --- Translation cache (in-memory LRU backed by an on-disk shelf) ---
+TRANSLATION_CACHE_FILE = 'translate_cache.db'
+TRANSLATION_CACHE_SIZE = 2048
+TRANSLATION_CACHE_PREFIX = 'tr:v2:'  # Bump the version to invalidate old entries
+translation_memo = OrderedDict()  # Most recently used entries at the end
+translation_cache_lock = threading.Lock()
+try:
+    translation_shelf = shelve.open(TRANSLATION_CACHE_FILE, writeback=False)
+except Exception as e:
+    logger.warning(f"⚠️  Could not open translation cache '{TRANSLATION_CACHE_FILE}': {e}")
+    translation_shelf = None
+
+# --- Normalize text so whitespace/Unicode variants share one cache entry ---
+def normalize_text(text):
+    return unicodedata.normalize('NFC', ' '.join(text.split()))
+
+def translation_cache_key(text, dest):
+    digest = hashlib.md5(normalize_text(text).encode('utf-8')).hexdigest()
+    return f"{TRANSLATION_CACHE_PREFIX}{digest}:{dest}"
+
+def cache_get(text, dest):
+    key = translation_cache_key(text, dest)
+    with translation_cache_lock:
+        if key in translation_memo:
+            translation_memo.move_to_end(key)
+            return translation_memo[key]
+        if translation_shelf is None:
+            return None
+        translation = translation_shelf.get(key)
+        if translation is not None:
+            translation_memo[key] = translation
+            if len(translation_memo) > TRANSLATION_CACHE_SIZE:
+                translation_memo.popitem(last=False)
+        return translation
+
+def cache_put(text, dest, translation):
+    key = translation_cache_key(text, dest)
+    with translation_cache_lock:
+        translation_memo[key] = translation
+        translation_memo.move_to_end(key)
+        if len(translation_memo) > TRANSLATION_CACHE_SIZE:
+            translation_memo.popitem(last=False)
+        if translation_shelf is not None:
+            translation_shelf[key] = translation
+
+def close_translation_cache():
+    with translation_cache_lock:
+        if translation_shelf is not None:
+            translation_shelf.close()
+
+atexit.register(close_translation_cache)
+
+# --- Shared worker pool for short one-shot background tasks ---
+task_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="task")
 
 # --- Global variables for controlling the listening state ---
 listening = False
@@ -28,68 +157,116 @@ stop_event = threading.Event()  # Event to signal thread to stop
 microphone = None
 recognizer = None
 noise_adjusted = False  # Flag to track if noise adjustment has been done
-audio_queue = []  # Queue to store captured audio clips
-
-# --- Print detailed microphone information at startup ---
-def print_microphone_info():
+pause_threshold = 0.5  # Seconds of silence to consider phrase complete
+NON_SPEAKING_DURATION = 0.3  # Silence kept around a phrase; must not exceed pause_threshold
+MIC_SAMPLE_RATE = 16000
+MIC_CHUNK_SIZE = 256  # Frames per read (~16 ms at 16 kHz) instead of the default 1024
+SILENCE_AMPLITUDE = 500  # 16-bit samples at or below this level count as silence
+audio_queue = queue.Queue()  # Captured audio clips; None tells the processor to exit
+recent_clip_hashes = deque(maxlen=4)  # Fingerprints of the last few recognized clips
+recent_transcripts = {}  # Clip fingerprint -> transcript, only for hashes in recent_clip_hashes
+
+# --- Streaming recognition settings (Google Cloud Speech) ---
+STREAM_SAMPLE_RATE = 16000
+STREAM_CHUNK_FRAMES = 1600  # 100 ms of audio per streaming request
+STREAM_LANGUAGE = 'en-US'
+STREAM_ALTERNATIVE_LANGUAGES = ['es-ES', 'fr-FR', 'de-DE']
+# Stream only when the client library and credentials are both available
+use_streaming = speech is not None and bool(os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'))
+
+# --- Enumerate input devices (cached until the user asks for a refresh) ---
+@functools.lru_cache(maxsize=1)
+def enumerate_microphones():
+    # Use PyAudio to get actual microphone names
+    audio = pyaudio.PyAudio()
     try:
-        logger.info("🎤 Microphone Information:")
-        logger.info("=" * 60)
-        
-        # Use PyAudio to get actual microphone names
-        audio = pyaudio.PyAudio()
         mic_info = []
-        
-        logger.info("Available microphones with names:")
-        logger.info("-" * 60)
-        
         for i in range(audio.get_device_count()):
             device_info = audio.get_device_info_by_index(i)
             # Check if it's an input device
             if device_info['maxInputChannels'] > 0:
-                name = device_info['name']
-                logger.info(f"   Index {i}: {name}")
-                mic_info.append((i, name))
-        
+                mic_info.append((i, device_info['name']))
+        return mic_info
+    finally:
         audio.terminate()
-        
-        if mic_info:
-            logger.info(f"\n🎧 Found {len(mic_info)} input devices")
-            logger.info("🔧 To use a specific microphone:")
-            logger.info("   1. Look for your Snowball in the list above")
-            logger.info("   2. Note its index number")
-            logger.info("   3. Click the corresponding button in the GUI")
-            logger.info("\n📝 IMPORTANT: Speak directly into the microphone for testing!")
-        else:
-            logger.warning("   No input devices found!")
-            
-    except Exception as e:
-        logger.error(f"⚠️  Could not retrieve detailed microphone information: {e}")
 
-# Call the function at startup
-print_microphone_info()
+# --- Print detailed microphone information ---
+def print_microphone_info(mic_info):
+    logger.info("🎤 Microphone Information:")
+    logger.info("=" * 60)
+    logger.info("Available microphones with names:")
+    logger.info("-" * 60)
+    for i, name in mic_info:
+        logger.info(f"   Index {i}: {name}")
+
+    if mic_info:
+        logger.info(f"\n🎧 Found {len(mic_info)} input devices")
+        logger.info("🔧 To use a specific microphone:")
+        logger.info("   1. Look for your Snowball in the microphone menu")
+        logger.info("   2. Select it in the GUI")
+        logger.info("\n📝 IMPORTANT: Speak directly into the microphone for testing!")
+    else:
+        logger.warning("   No input devices found!")
+
+# --- Speak asynchronously using one long-lived pyttsx3 engine ---
+tts_queue = queue.Queue()  # Utterances waiting to be spoken, in order
+
+def tts_worker():
+    # The engine is created once and only used from this thread (COM/SAPI affinity)
+    engine = pyttsx3.init()
+    while True:
+        text = tts_queue.get()
+        if text is None:
+            break
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        except Exception as e:
+            logger.error(f"[ERROR] Text-to-speech failed: {e}")
+
+tts_thread = threading.Thread(target=tts_worker, daemon=True)
+tts_thread.start()
 
-# --- Speak asynchronously using pyttsx3 (new engine per call) ---
 def speak_async(text):
-    def _speak():
-        engine = pyttsx3.init()  # Fresh engine in each thread
-        engine.say(text)
-        engine.runAndWait()
+    # Queued utterances play one after another instead of overlapping
+    tts_queue.put(text)
+
+# --- Run a Tk call on the main thread (Tk widgets are not thread-safe) ---
+def run_on_ui(fn, *args, **kwargs):
+    root.after(0, lambda: fn(*args, **kwargs))
 
-    speaker_thread = threading.Thread(target=_speak, daemon=True)
-    speaker_thread.start()
+# --- Split text into sentences so each one is cached independently ---
+SENTENCE_PATTERN = re.compile(r'[^.?!。]+[.?!。]?')
+
+def split_sentences(text):
+    return [s.strip() for s in SENTENCE_PATTERN.findall(text) if s.strip()]
 
 # --- Fast Translation via Google Translate ---
-def fast_translate(text):
+def fast_translate(text, dest='en', on_sentence=None):
     try:
         start_time = datetime.now()
-        result = translator.translate(text, src='auto', dest='en')
+        # Only the normalized form is cached and sent; callers display the original
+        sentences = split_sentences(normalize_text(text))
+        # Recurring phrases are served from the cache without a network round-trip
+        translations = [cache_get(sentence, dest) for sentence in sentences]
+        # Every cache miss is requested up front so they translate concurrently
+        pending = {i: submit_translation(sentence, dest)
+                   for i, sentence in enumerate(sentences) if translations[i] is None}
+        if not pending:
+            logger.info("[💾] Translation served from cache")
+        for i, sentence in enumerate(sentences):
+            if i in pending:
+                translations[i] = pending[i].result(timeout=TRANSLATE_TIMEOUT)
+                cache_put(sentence, dest, translations[i])
+            # Hand each sentence on as soon as it is ready (e.g. to start speaking it)
+            if on_sentence is not None:
+                on_sentence(translations[i])
         elapsed = datetime.now() - start_time
         logger.info(f"\n[⏱️] Translated in {elapsed.total_seconds():.2f}s")
-        return result.text
+        return ' '.join(translations)
     except Exception as e:
         logger.error(f"\n[ERROR] Translation failed: {e}")
-        status_label.config(text="[!] Translation Failed", fg="red")
+        run_on_ui(status_label.config, text="[!] Translation Failed", fg="red")
         return None
 
 # --- Manual translation function ---
@@ -100,11 +277,10 @@ def manual_translate():
         original_text_var.set(f"You typed: {text}")
         
         # Translate the text
-        translation = fast_translate(text)
+        translation = fast_translate(text, on_sentence=speak_async)
         if translation:
             logger.info(f"\n✅ Translated: {translation}")
             translated_text_var.set(f"Translation: {translation}")
-            speak_async(translation)
         else:
             logger.warning("[!] Failed to get translation.")
             translated_text_var.set("[!] Translation failed")
@@ -112,63 +288,105 @@ def manual_translate():
         original_text_var.set("Please enter some text to translate")
         translated_text_var.set("")
 
+# --- Show (and log) the outcome of translating a recognized transcript ---
+def show_translation(translation):
+    if translation:
+        logger.info(f"\n✅ Translated: {translation}")
+        run_on_ui(translated_text_var.set, f"Translation: {translation}")  # Update GUI with translation
+    else:
+        logger.warning("[!] Failed to get translation.")
+        run_on_ui(translated_text_var.set, "[!] Translation failed")
+
+# --- Display, translate and speak a recognized transcript ---
+def handle_transcript(text):
+    # Only process non-empty text
+    if text and text.strip():
+        logger.info(f"🗣️ You said: {text}")
+        run_on_ui(original_text_var.set, f"You said: {text}")  # Update GUI with original text
+
+        # Translate the recognized text
+        # Sentences are spoken as they are translated, before the rest have arrived
+        show_translation(fast_translate(text, on_sentence=speak_async))
+
+# --- Trim leading/trailing silence so less audio is uploaded ---
+def trim_silence(audio):
+    pcm = np.frombuffer(audio.get_raw_data(), dtype=np.int16)
+    voiced = np.abs(pcm) > SILENCE_AMPLITUDE
+    if not voiced.any():
+        return audio
+    start = int(voiced.argmax())
+    end = len(voiced) - int(voiced[::-1].argmax())
+    if start == 0 and end == len(pcm):
+        return audio
+    return sr.AudioData(pcm[start:end].tobytes(), audio.sample_rate, audio.sample_width)
+
 # --- Process audio clip ---
 def process_audio_clip(audio):
     try:
+        audio = trim_silence(audio)
+
+        # Identical back-to-back clips reuse the transcript instead of another round-trip
+        clip_hash = hashlib.md5(audio.get_raw_data()).hexdigest()
+        if clip_hash in recent_transcripts:
+            logger.info("[💾] Duplicate clip, reusing previous transcript")
+            handle_transcript(recent_transcripts[clip_hash])
+            return
+
         logger.info("🔍 Recognizing speech...")
         text = recognizer.recognize_google(audio, language="*")  # Auto-detect language
-        
-        # Only process non-empty text
-        if text and text.strip():
-            logger.info(f"🗣️ You said: {text}")
-            original_text_var.set(f"You said: {text}")  # Update GUI with original text
-            
-            # Translate the recognized text
-            translation = fast_translate(text)
-            if translation:
-                logger.info(f"\n✅ Translated: {translation}")
-                translated_text_var.set(f"Translation: {translation}")  # Update GUI with translation
-                speak_async(translation)
-            else:
-                logger.warning("[!] Failed to get translation.")
-                translated_text_var.set("[!] Translation failed")
+        if len(recent_clip_hashes) == recent_clip_hashes.maxlen:
+            recent_transcripts.pop(recent_clip_hashes[0], None)
+        recent_clip_hashes.append(clip_hash)
+        recent_transcripts[clip_hash] = text
+        handle_transcript(text)
                 
     except sr.UnknownValueError:
         logger.warning("[!] Could not understand audio.")
-        original_text_var.set("[!] Could not understand audio")
-        translated_text_var.set("")
+        run_on_ui(original_text_var.set, "[!] Could not understand audio")
+        run_on_ui(translated_text_var.set, "")
     except sr.RequestError as e:
         logger.error(f"[ERROR] Could not request results; {e}")
-        original_text_var.set("[ERROR] Speech recognition service error")
-        translated_text_var.set("")
+        run_on_ui(original_text_var.set, "[ERROR] Speech recognition service error")
+        run_on_ui(translated_text_var.set, "")
     except Exception as e:
         logger.error(f"[ERROR] Unexpected error in processing: {e}")
-        original_text_var.set("[ERROR] Unexpected error occurred")
-        translated_text_var.set("")
+        run_on_ui(original_text_var.set, "[ERROR] Unexpected error occurred")
+        run_on_ui(translated_text_var.set, "")
 
 # --- Audio processing thread ---
 def process_audio_queue():
-    while not stop_event.is_set():
-        if audio_queue:
-            audio = audio_queue.pop(0)
-            process_audio_clip(audio)
-        else:
-            # Small delay to prevent busy waiting
-            threading.Event().wait(0.1)
+    while True:
+        # Block until a clip arrives instead of polling
+        audio = audio_queue.get()
+        if audio is None:
+            break
+        process_audio_clip(audio)
     logger.info("⏹️ Audio processing stopped.")
 
+# --- Recognizer that measures ambient noise with a single NumPy reduction ---
+class FastRecognizer(sr.Recognizer):
+    def adjust_for_ambient_noise(self, source, duration=1):
+        assert source.stream is not None, "Audio source must be entered before adjusting"
+        buffer_count = max(1, int(duration * source.SAMPLE_RATE / source.CHUNK))
+        buffer = b"".join(source.stream.read(source.CHUNK) for _ in range(buffer_count))
+        # sr.Microphone records 16-bit PCM, so the buffer is int16 samples
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32)
+        energy = float(np.sqrt(np.mean(samples ** 2)))
+        self.energy_threshold = energy * self.dynamic_energy_ratio
+
 # --- Initialize microphone and adjust for noise ---
 def initialize_microphone():
     global microphone, recognizer, noise_adjusted
     if recognizer is None:
-        recognizer = sr.Recognizer()
+        recognizer = FastRecognizer()
     
     # Use specific microphone if set, otherwise use system default
     if current_mic_index is not None:
-        microphone = sr.Microphone(device_index=current_mic_index)
+        microphone = sr.Microphone(device_index=current_mic_index, sample_rate=MIC_SAMPLE_RATE,
+                                   chunk_size=MIC_CHUNK_SIZE)
         logger.info(f"🎤 Using microphone index: {current_mic_index}")
     else:
-        microphone = sr.Microphone()
+        microphone = sr.Microphone(sample_rate=MIC_SAMPLE_RATE, chunk_size=MIC_CHUNK_SIZE)
         logger.info("🎤 Using system default microphone")
     
     # Adjust for ambient noise only once
@@ -179,11 +397,79 @@ def initialize_microphone():
         noise_adjusted = True
         logger.info("✅ Noise adjustment completed")
 
+# --- Stream microphone audio to Google Cloud Speech ---
+def stream_microphone():
+    chunks = queue.Queue()
+
+    # PyAudio callback: hand each 100 ms buffer straight to the request generator
+    def on_audio(in_data, frame_count, time_info, status):
+        chunks.put(in_data)
+        return (None, pyaudio.paContinue)
+
+    def audio_requests():
+        while listening and not stop_event.is_set():
+            try:
+                chunk = chunks.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+    config = speech.StreamingRecognitionConfig(
+        config=speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=STREAM_SAMPLE_RATE,
+            language_code=STREAM_LANGUAGE,
+            alternative_language_codes=STREAM_ALTERNATIVE_LANGUAGES,
+        ),
+        interim_results=True,
+    )
+    audio = None
+    stream = None
+    try:
+        # Opening the device can fail (busy device, invalid index)
+        audio = pyaudio.PyAudio()
+        stream = audio.open(format=pyaudio.paInt16, channels=1, rate=STREAM_SAMPLE_RATE,
+                            input=True, input_device_index=current_mic_index,
+                            frames_per_buffer=STREAM_CHUNK_FRAMES, stream_callback=on_audio)
+        logger.info("🎤 Streaming... Please SPEAK into the microphone now.")
+        client = speech.SpeechClient()
+        for response in client.streaming_recognize(config, audio_requests()):
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                transcript = result.alternatives[0].transcript
+                if result.is_final:
+                    handle_transcript(transcript)
+                else:
+                    # Show partial transcripts while the user is still talking
+                    run_on_ui(original_text_var.set, f"Hearing: {transcript}")
+    except Exception as e:
+        if stream is None:
+            logger.error(f"[ERROR] Microphone error: {e}")
+            run_on_ui(original_text_var.set, "[ERROR] Microphone error")
+        else:
+            logger.error(f"[ERROR] Streaming recognition error: {e}")
+            run_on_ui(original_text_var.set, "[ERROR] Speech recognition service error")
+        run_on_ui(translated_text_var.set, "")
+    finally:
+        # Only release what was actually opened
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
+        if audio is not None:
+            audio.terminate()
+
+    logger.info("⏹️ Microphone streaming stopped.")
+
 # --- Listen to microphone input ---
 def listen_to_microphone():
     global listening, current_mic_index, processing_thread
     stop_event.clear()  # Clear the stop event
     
+    if use_streaming:
+        stream_microphone()
+        return
+    
     # Initialize microphone if not already done
     if microphone is None or recognizer is None:
         initialize_microphone()
@@ -208,13 +494,14 @@ def listen_to_microphone():
                     logger.info("🎙️  Ready to receive audio...")
                     # Listen with energy threshold to avoid picking up background noise
                     recognizer.energy_threshold = 300  # Adjust sensitivity
-                    recognizer.pause_threshold = 1.0   # Seconds of silence to consider phrase complete
+                    recognizer.pause_threshold = pause_threshold
+                    recognizer.non_speaking_duration = min(NON_SPEAKING_DURATION, pause_threshold)
                     
                     # Listen for audio with shorter timeout
                     audio = recognizer.listen(source, timeout=2, phrase_time_limit=6)
                     
                     # Add audio to queue for processing
-                    audio_queue.append(audio)
+                    audio_queue.put(audio)
                     logger.info("🎵 Audio captured and queued for processing")
                     
                 except sr.WaitTimeoutError:
@@ -231,8 +518,8 @@ def listen_to_microphone():
                     
     except Exception as e:
         logger.error(f"[ERROR] Microphone error: {e}")
-        original_text_var.set("[ERROR] Microphone error")
-        translated_text_var.set("")
+        run_on_ui(original_text_var.set, "[ERROR] Microphone error")
+        run_on_ui(translated_text_var.set, "")
     
     logger.info("⏹️ Microphone listening stopped.")
 
@@ -269,12 +556,11 @@ def stop_listening():
         
         # Wait a bit for processing to complete, then reset status
         def reset_status():
-            threading.Event().wait(3)  # Wait 3 seconds for processing
+            time.sleep(3)  # Wait 3 seconds for processing
             if not listening:  # Only reset if we're still not listening
-                status_label.config(text="Status: Idle", fg="orange")
+                run_on_ui(status_label.config, text="Status: Idle", fg="orange")
         
-        reset_thread = threading.Thread(target=reset_status, daemon=True)
-        reset_thread.start()
+        task_pool.submit(reset_status)
 
 # --- Set specific microphone index ---
 def set_microphone_index(index):
@@ -284,12 +570,55 @@ def set_microphone_index(index):
     logger.info(f"🔧 Microphone index set to: {index}")
     status_label.config(text=f"Status: Mic {index} selected", fg="purple")
 
+# --- Fill the microphone menu (lazily, on first open or on refresh) ---
+def populate_microphone_menu(refresh=False):
+    global mic_menu_populated
+    if mic_menu_populated and not refresh:
+        return
+    if refresh:
+        enumerate_microphones.cache_clear()
+    try:
+        mic_info = enumerate_microphones()
+    except Exception as e:
+        logger.error(f"⚠️  Could not retrieve detailed microphone information: {e}")
+        return
+    print_microphone_info(mic_info)
+
+    menu = mic_menu['menu']
+    menu.delete(0, 'end')
+    # Keep a way back to the default device (index None)
+    menu.add_command(label="System default", command=lambda: select_microphone(None, "System default"))
+    for index, name in mic_info:
+        label = f"{index}: {name}"
+        menu.add_command(label=label, command=lambda idx=index, label=label: select_microphone(idx, label))
+    mic_menu_populated = True
+
+def select_microphone(index, label):
+    mic_choice_var.set(label)
+    set_microphone_index(index)
+
+# --- Set end-of-phrase silence (called from the slider) ---
+def set_pause_threshold(value):
+    global pause_threshold
+    pause_threshold = float(value)
+    logger.info(f"🔧 Pause threshold set to: {pause_threshold:.1f}s")
+
+# --- Shut down worker threads and close the window ---
+def shutdown_app():
+    global listening
+    listening = False
+    stop_event.set()
+    audio_queue.put(None)  # Wake the processing thread so it can exit
+    tts_queue.put(None)
+    task_pool.shutdown(wait=False, cancel_futures=True)
+    root.destroy()
+
 # --- Create GUI ---
 root = tk.Tk()
 root.title("🎤 Real-Time Voice Translator")
-root.geometry("600x800")  # Increased height for manual input
+root.geometry("600x880")  # Increased height for manual input and pause slider
 root.configure(bg="#f0f0f0")
-root.minsize(600, 800)  # Set minimum size
+root.minsize(600, 880)  # Set minimum size
 
 # Header Frame
 header_frame = tk.Frame(root, bg="#2c3e50", height=70)
@@ -367,21 +696,34 @@ mic_panel = tk.LabelFrame(content_frame, text="Microphone Settings",
                          font=("Arial", 12, "bold"), bg="#f0f0f0", fg="#2c3e50")
 mic_panel.pack(fill=tk.X, pady=(0, 20))
 
-mic_label = tk.Label(mic_panel, text="Select Microphone Index:", 
+mic_label = tk.Label(mic_panel, text="Select Microphone:", 
                     font=("Arial", 10), bg="#f0f0f0")
 mic_label.pack(pady=(10, 5))
 
-# Create buttons for common microphone indices
-mic_buttons_frame = tk.Frame(mic_panel, bg="#f0f0f0")
-mic_buttons_frame.pack(pady=10)
-
-# Buttons for indices 0-9 - FIXED using default argument technique
-for i in range(10):
-    btn = tk.Button(mic_buttons_frame, text=str(i), width=3, 
-                   command=lambda idx=i: set_microphone_index(idx),
-                   font=("Arial", 9), bg="#bdc3c7", fg="black",
-                   activebackground="#95a5a6", relief=tk.RAISED)
-    btn.pack(side=tk.LEFT, padx=3)
+mic_select_frame = tk.Frame(mic_panel, bg="#f0f0f0")
+mic_select_frame.pack(pady=10)
+
+# Devices are only enumerated when the menu is first opened or refreshed
+mic_menu_populated = False
+mic_choice_var = tk.StringVar(value="System default")
+mic_menu = tk.OptionMenu(mic_select_frame, mic_choice_var, "System default")
+mic_menu.config(font=("Arial", 9), bg="#bdc3c7", fg="black",
+               activebackground="#95a5a6", width=35)
+mic_menu['menu'].config(postcommand=populate_microphone_menu)
+mic_menu.pack(side=tk.LEFT, padx=3)
+
+refresh_mics_button = tk.Button(mic_select_frame, text="🔄 Refresh Mics",
+                               command=lambda: populate_microphone_menu(refresh=True),
+                               font=("Arial", 9), bg="#bdc3c7", fg="black",
+                               activebackground="#95a5a6", relief=tk.RAISED)
+refresh_mics_button.pack(side=tk.LEFT, padx=3)
+
+# Slider for the silence that ends a phrase (shorter = faster response)
+pause_scale = tk.Scale(mic_panel, from_=0.3, to=1.5, resolution=0.1, orient=tk.HORIZONTAL,
+                      label="End-of-phrase pause (s)", command=set_pause_threshold,
+                      font=("Arial", 9), bg="#f0f0f0", length=300)
+pause_scale.set(pause_threshold)
+pause_scale.pack(pady=(0, 10))
 
 # Control Panel
 control_panel = tk.Frame(content_frame, bg="#f0f0f0")
@@ -399,7 +741,7 @@ hold_button.bind("<ButtonPress-1>", lambda event: start_listening())
 hold_button.bind("<ButtonRelease-1>", lambda event: stop_listening())
 
 # Exit button
-exit_button = tk.Button(control_panel, text="❌ Exit", command=root.destroy, 
+exit_button = tk.Button(control_panel, text="❌ Exit", command=shutdown_app, 
                        font=("Arial", 12), bg="#e74c3c", fg="white", 
                        height=1, width=10, relief=tk.RAISED, bd=2,
                        activebackground="#c0392b")
@@ -411,12 +753,12 @@ footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
 footer_frame.pack_propagate(False)
 
 instructions = tk.Label(footer_frame, 
-                       text="1. Select mic index | 2. HOLD 'Hold to Listen' button | 3. SPEAK into mic", 
+                       text="1. Select microphone | 2. HOLD 'Hold to Listen' button | 3. SPEAK into mic", 
                        font=("Arial", 9), fg="white", bg="#34495e")
 instructions.pack(pady=(10, 0))
 
 help_text = tk.Label(footer_frame, 
-                    text="Look for 'Snowball' in console list. Speak clearly!", 
+                    text="Look for 'Snowball' in the microphone menu. Speak clearly!", 
                     font=("Arial", 8), fg="#aed6f1", bg="#34495e")
 help_text.pack()
 
@@ -428,5 +770,11 @@ more_help.pack()
 # Force window to update and show all content
 root.update_idletasks()
 
+# Open the translation connection now so the first phrase skips the TLS handshake
+keep_translation_connection_warm()
+
+# Route the window close button through the same shutdown path
+root.protocol("WM_DELETE_WINDOW", shutdown_app)
+
 # Start the GUI event loop
 root.mainloop()
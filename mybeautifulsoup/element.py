@@ -5,7 +5,99 @@ Provides Tag, NavigableString, and Comment classes for representing HTML/XML ele
 """
 
 import re
-from typing import Optional, List, Dict, Any, Iterator, Union, Callable
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Union, Callable, Tuple
+
+
+# Read-only stand-in for the attributes of a tag that has none
+_NO_ATTRS = MappingProxyType({})
+
+# Matches an attribute selector part such as 'a[href^=http]'
+_ATTR_SELECTOR_RE = re.compile(r'(\w*)?\[([^\]]+)\]')
+
+# A single pre-parsed CSS selector part (e.g. 'div.a', '#x', 'a[href^=http]').
+# kind is one of 'id', 'class', 'attr', 'tag', 'combinator' ('>', skipped when
+# filtering) or 'none' (never matches).
+SelectorPart = namedtuple('SelectorPart', ['kind', 'tag_name', 'id', 'classes',
+                                           'attr_op', 'attr_name', 'attr_value'])
+
+
+def _compile_selector_part(part: str) -> SelectorPart:
+    """Parse one whitespace-free selector part into a SelectorPart."""
+    if part == '>':
+        return SelectorPart('combinator', '', None, (), None, None, None)
+
+    # Handle ID selector
+    if '#' in part:
+        tag_name, _, id_val = part.partition('#')
+        classes = ()
+        if '.' in id_val:
+            id_val, _, class_part = id_val.partition('.')
+            classes = (class_part,)
+        return SelectorPart('id', tag_name.lower(), id_val, classes, None, None, None)
+
+    # Handle class selector
+    if '.' in part:
+        parts = part.split('.')
+        return SelectorPart('class', parts[0].lower(), None, tuple(parts[1:]), None, None, None)
+
+    # Handle attribute selector
+    if '[' in part:
+        match = _ATTR_SELECTOR_RE.match(part)
+        if not match:
+            return SelectorPart('none', '', None, (), None, None, None)
+        tag_name, attr_selector = match.groups()
+        tag_name = (tag_name or '').lower()
+
+        if '=' not in attr_selector:
+            # Just checking for attribute existence
+            return SelectorPart('attr', tag_name, None, (), None, attr_selector, None)
+
+        for op in ('~=', '^=', '$=', '*='):
+            if op in attr_selector:
+                break
+        else:
+            op = '='
+        attr_name, attr_value = attr_selector.split(op)
+        return SelectorPart('attr', tag_name, None, (), op, attr_name, attr_value.strip('"\''))
+
+    # Handle tag name only
+    return SelectorPart('tag', part.lower(), None, (), None, None, None)
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> Tuple[Tuple[SelectorPart, ...], ...]:
+    """
+    Parse a (possibly comma-separated) CSS selector once.
+
+    Returns one tuple of SelectorParts per comma-separated selector. Results
+    are cached, so repeated select() calls with the same string skip parsing.
+    """
+    compiled = []
+    for sel in selector.split(','):
+        parts = sel.split()
+        compiled.append(tuple(_compile_selector_part(part) for part in parts))
+    return tuple(compiled)
+
+
+@lru_cache(maxsize=1024)
+def _split_attribute_value(value: str) -> Tuple[str, ...]:
+    """
+    Split a whitespace-separated attribute value such as class="a b".
+
+    The parser already stores class as a list; this covers string values set
+    by hand, which would otherwise be re-split on every CSS match.
+    """
+    return tuple(value.split())
+
+
+@lru_cache(maxsize=64)
+def _indent(level: int) -> str:
+    """Indentation prefix for pretty-printing at the given depth."""
+    return '  ' * level
 
 
 class NavigableString(str):
@@ -60,6 +152,14 @@ class Tag:
     Represents an HTML/XML tag with attributes and children.
     """
 
+    # Slots keep per-node memory small; attrs are stored lazily in _attrs
+    __slots__ = (
+        'name', '_attrs', 'parent', 'parser', 'contents',
+        'previous_sibling', 'next_sibling', 'previous_element', 'next_element',
+        '_parent_index', '_attrs_str', '_attrs_exposed',
+        '__weakref__',
+    )
+
     SELF_CLOSING_TAGS = frozenset([
         'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
         'link', 'meta', 'param', 'source', 'track', 'wbr'
@@ -72,11 +172,21 @@ class Tag:
         parent: Optional['Tag'] = None,
         parser: Optional[Any] = None
     ):
-        self.name = name.lower() if name else ''
-        self.attrs = attrs or {}
+        # Interned so name comparisons usually succeed on identity alone
+        self.name = sys.intern(name.lower()) if name else ''
+        self._attrs = attrs
         self.parent = parent
         self.parser = parser
         self.contents: List[Union['Tag', NavigableString]] = []
+        # Last known position in parent.contents; verified by identity before use
+        self._parent_index = -1
+        # Rendered attribute string. Once a mutable reference to attrs (or
+        # to a list value in it) has been handed out, changes can no longer
+        # be observed and the cache is bypassed for good. A caller-supplied
+        # dict is such a reference; only builders hand theirs over (see
+        # _from_builder).
+        self._attrs_str: Optional[str] = None
+        self._attrs_exposed = attrs is not None
 
         # Navigation links
         self.previous_sibling: Optional[Union['Tag', NavigableString]] = None
@@ -84,6 +194,19 @@ class Tag:
         self.previous_element: Optional[Union['Tag', NavigableString]] = None
         self.next_element: Optional[Union['Tag', NavigableString]] = None
 
+    @classmethod
+    def _from_builder(
+        cls,
+        name: str,
+        attrs: Dict[str, Any],
+        parent: Optional['Tag'] = None
+    ) -> 'Tag':
+        """Create a tag that takes ownership of a builder-made attrs dict."""
+        tag = cls(name=name, parent=parent)
+        # Most tags have no attributes; their dict is only created on demand
+        tag._attrs = attrs or None
+        return tag
+
     def __repr__(self) -> str:
         return f"<{self.name}>"
 
@@ -99,33 +222,61 @@ class Tag:
     def __iter__(self) -> Iterator[Union['Tag', NavigableString]]:
         return iter(self.contents)
 
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        """Attribute dictionary (created on first access for attribute-less tags)."""
+        if self._attrs is None:
+            self._attrs = {}
+        self._attrs_exposed = True
+        return self._attrs
+
+    @attrs.setter
+    def attrs(self, value: Optional[Dict[str, Any]]) -> None:
+        self._attrs = value
+        self._attrs_exposed = True
+
     def __getitem__(self, key: str) -> Any:
         """Get attribute value like a dictionary."""
-        return self.attrs.get(key)
+        return self.get(key)
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Set attribute value like a dictionary."""
-        self.attrs[key] = value
+        if self._attrs is None:
+            self._attrs = {}
+        self._attrs[key] = value
+        self._attrs_str = None
+        if isinstance(value, list):
+            self._attrs_exposed = True
 
     def __contains__(self, key: str) -> bool:
         """Check if attribute exists."""
-        return key in self.attrs
+        return bool(self._attrs) and key in self._attrs
 
     def __eq__(self, other: Any) -> bool:
+        # Structural equality is public API, but internal list bookkeeping
+        # (extract, replace_with, unwrap) locates nodes by identity and
+        # never reaches this deep comparison.
+        if self is other:
+            return True
         if not isinstance(other, Tag):
             return False
         return (self.name == other.name and
-                self.attrs == other.attrs and
+                (self._attrs or _NO_ATTRS) == (other._attrs or _NO_ATTRS) and
                 self.contents == other.contents)
 
-    def __hash__(self) -> int:
-        return id(self)
+    # Identity hashing; defining __eq__ would otherwise make Tag unhashable.
+    # Distinct tags never share a hash, so sets and dicts of tags behave by
+    # identity without ever falling back to the deep __eq__.
+    __hash__ = object.__hash__
 
     def __getattr__(self, name: str) -> Optional['Tag']:
         """Allow accessing first child tag by name (e.g., tag.div, tag.p)."""
         if name.startswith('_'):
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
-        return self.find(name)
+        # Straight to the name-only fast path; tag.div is the first
+        # descendant <div> in document order, so it cannot be answered
+        # from the direct children alone.
+        return self._find_one(name)
 
     @property
     def string(self) -> Optional[str]:
@@ -141,18 +292,24 @@ class Tag:
     @property
     def strings(self) -> Iterator[str]:
         """Yield all strings within this tag."""
-        for child in self.descendants:
-            if isinstance(child, NavigableString) and not isinstance(child, Comment):
-                if str(child).strip():
-                    yield str(child)
+        return self._iter_text(strip=False)
 
     @property
     def stripped_strings(self) -> Iterator[str]:
         """Yield all strings within this tag, with whitespace stripped."""
-        for s in self.strings:
-            stripped = s.strip()
-            if stripped:
-                yield stripped
+        return self._iter_text(strip=True)
+
+    def _iter_text(self, strip: bool) -> Iterator[str]:
+        """Yield non-blank, non-comment strings in document order in one stack walk."""
+        stack = list(reversed(self.contents))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                stack.extend(reversed(node.contents))
+            elif isinstance(node, NavigableString) and not isinstance(node, Comment):
+                stripped = node.strip()
+                if stripped:
+                    yield stripped if strip else str(node)
 
     @property
     def text(self) -> str:
@@ -172,6 +329,20 @@ class Tag:
             if isinstance(child, Tag):
                 yield from child.descendants
 
+    def _iter_descendant_tags(self) -> Iterator['Tag']:
+        """Iterate over descendant tags in document order, without recursion."""
+        stack = [child for child in reversed(self.contents) if isinstance(child, Tag)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend([child for child in reversed(node.contents) if isinstance(child, Tag)])
+
+    def _iter_candidate_tags(self, recursive: bool = True) -> Iterator['Tag']:
+        """Iterate over descendant tags, or only child tags if not recursive."""
+        if recursive:
+            return self._iter_descendant_tags()
+        return (child for child in self.contents if isinstance(child, Tag))
+
     @property
     def parents(self) -> Iterator['Tag']:
         """Iterate over all parent tags."""
@@ -198,25 +369,37 @@ class Tag:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get attribute value with default."""
-        return self.attrs.get(key, default)
+        attrs = self._attrs
+        if not attrs:
+            return default
+        value = attrs.get(key, default)
+        if isinstance(value, list):
+            # List values can be mutated in place by the caller
+            self._attrs_exposed = True
+        return value
 
     def get_text(self, separator: str = '', strip: bool = False) -> str:
         """Get all text content, optionally with separator and stripping."""
-        if strip:
-            return separator.join(self.stripped_strings)
-        return separator.join(self.strings)
+        return separator.join(self._iter_text(strip))
 
     def has_attr(self, key: str) -> bool:
         """Check if this tag has a specific attribute."""
-        return key in self.attrs
+        return bool(self._attrs) and key in self._attrs
 
     def get_attribute_list(self, key: str) -> List[str]:
         """Get attribute value as a list (for class, etc.)."""
-        value = self.attrs.get(key, [])
+        value = self.get(key, [])
         if isinstance(value, list):
             return value
         return value.split() if value else []
 
+    def _attribute_list(self, key: str) -> Union[List[str], Tuple[str, ...]]:
+        """Read-only get_attribute_list for internal matching."""
+        value = (self._attrs or _NO_ATTRS).get(key)
+        if isinstance(value, list):
+            return value
+        return _split_attribute_value(value) if value else ()
+
     def append(self, child: Union['Tag', NavigableString, str]) -> None:
         """Append a child element."""
         if isinstance(child, str) and not isinstance(child, NavigableString):
@@ -228,6 +411,7 @@ class Tag:
             child.previous_sibling = last_child
 
         child.parent = self
+        child._parent_index = len(self.contents)
         self.contents.append(child)
 
     def insert(self, position: int, child: Union['Tag', NavigableString, str]) -> None:
@@ -235,14 +419,47 @@ class Tag:
         if isinstance(child, str) and not isinstance(child, NavigableString):
             child = NavigableString(child)
 
+        # Resolve where list.insert will actually place the child
+        contents = self.contents
+        size = len(contents)
+        if position < 0:
+            position = max(0, position + size)
+        elif position > size:
+            position = size
+
         child.parent = self
-        self.contents.insert(position, child)
-        self._update_sibling_links()
+        child._parent_index = position
+        contents.insert(position, child)
+
+        # Only the new child and its two neighbors need relinking
+        previous = contents[position - 1] if position > 0 else None
+        following = contents[position + 1] if position + 1 < len(contents) else None
+        child.previous_sibling = previous
+        child.next_sibling = following
+        if previous is not None:
+            previous.next_sibling = child
+        if following is not None:
+            following.previous_sibling = child
 
     def extend(self, children: List[Union['Tag', NavigableString, str]]) -> None:
         """Append multiple children."""
-        for child in children:
-            self.append(child)
+        children = [
+            NavigableString(child) if isinstance(child, str) and not isinstance(child, NavigableString)
+            else child
+            for child in children
+        ]
+
+        # Link the new children in one pass, then grow contents once
+        contents = self.contents
+        previous = contents[-1] if contents else None
+        for i, child in enumerate(children, len(contents)):
+            child.parent = self
+            child._parent_index = i
+            child.previous_sibling = previous
+            if previous is not None:
+                previous.next_sibling = child
+            previous = child
+        contents.extend(children)
 
     def clear(self) -> None:
         """Remove all children."""
@@ -255,14 +472,23 @@ class Tag:
     def extract(self) -> 'Tag':
         """Remove this element from the tree and return it."""
         if self.parent:
-            self.parent.contents.remove(self)
-            self.parent._update_sibling_links()
+            contents = self.parent.contents
+            idx = self._index_in_parent()
+            del contents[idx]
+            # Link the former neighbors to each other
+            previous = contents[idx - 1] if idx > 0 else None
+            following = contents[idx] if idx < len(contents) else None
+            if previous is not None:
+                previous.next_sibling = following
+            if following is not None:
+                following.previous_sibling = previous
+        else:
+            if self.previous_sibling:
+                self.previous_sibling.next_sibling = self.next_sibling
+            if self.next_sibling:
+                self.next_sibling.previous_sibling = self.previous_sibling
 
         self.parent = None
-        if self.previous_sibling:
-            self.previous_sibling.next_sibling = self.next_sibling
-        if self.next_sibling:
-            self.next_sibling.previous_sibling = self.previous_sibling
         self.previous_sibling = None
         self.next_sibling = None
 
@@ -279,9 +505,10 @@ class Tag:
             replacement = NavigableString(replacement)
 
         if self.parent:
-            idx = self.parent.contents.index(self)
+            idx = self._index_in_parent()
             self.parent.contents[idx] = replacement
             replacement.parent = self.parent
+            replacement._parent_index = idx
             replacement.previous_sibling = self.previous_sibling
             replacement.next_sibling = self.next_sibling
 
@@ -305,19 +532,57 @@ class Tag:
     def unwrap(self) -> 'Tag':
         """Replace this element with its contents."""
         if self.parent:
-            idx = self.parent.contents.index(self)
-            self.parent.contents[idx:idx+1] = self.contents
-            for child in self.contents:
-                child.parent = self.parent
-            self.parent._update_sibling_links()
+            parent = self.parent
+            contents = parent.contents
+            children = self.contents
+            idx = self._index_in_parent()
+            contents[idx:idx+1] = children
+            for i, child in enumerate(children, idx):
+                child.parent = parent
+                child._parent_index = i
+
+            # Splice the links at the two boundaries only
+            end = idx + len(children)
+            previous = contents[idx - 1] if idx > 0 else None
+            following = contents[end] if end < len(contents) else None
+            first = children[0] if children else following
+            last = children[-1] if children else previous
+            if previous is not None:
+                previous.next_sibling = first
+            if following is not None:
+                following.previous_sibling = last
+            if children:
+                first.previous_sibling = previous
+                last.next_sibling = following
 
         self.parent = None
         self.contents = []
         return self
 
+    def _index_in_parent(self) -> int:
+        """
+        Return this element's position in parent.contents.
+
+        Uses the cached _parent_index when it still points at this element and
+        otherwise scans by identity, never falling back to the deep Tag.__eq__.
+        """
+        contents = self.parent.contents
+        hint = self._parent_index
+        # Inserting or removing an earlier sibling shifts the position by one
+        for i in (hint, hint - 1, hint + 1):
+            if 0 <= i < len(contents) and contents[i] is self:
+                self._parent_index = i
+                return i
+        for i, child in enumerate(contents):
+            if child is self:
+                self._parent_index = i
+                return i
+        raise ValueError(f"{self!r} is not in its parent's contents")
+
     def _update_sibling_links(self) -> None:
-        """Update sibling links for all children."""
+        """Update sibling links (and cached positions) for all children."""
         for i, child in enumerate(self.contents):
+            child._parent_index = i
             child.previous_sibling = self.contents[i-1] if i > 0 else None
             child.next_sibling = self.contents[i+1] if i < len(self.contents) - 1 else None
 
@@ -330,8 +595,34 @@ class Tag:
         **kwargs
     ) -> Optional['Tag']:
         """Find the first matching tag."""
-        results = self.find_all(name, attrs, recursive, string, limit=1, **kwargs)
-        return results[0] if results else None
+        return self._find_one(name, attrs, recursive, string, **kwargs)
+
+    def _find_one(
+        self,
+        name: Optional[Union[str, List[str], re.Pattern, Callable]] = None,
+        attrs: Optional[Dict[str, Any]] = None,
+        recursive: bool = True,
+        string: Optional[Union[str, re.Pattern]] = None,
+        **kwargs
+    ) -> Optional['Tag']:
+        """Return the first matching tag without building a result list."""
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+
+        iterator = self._iter_candidate_tags(recursive)
+
+        # Plain name lookups (e.g. tag.div) only need a name comparison
+        if isinstance(name, str) and not attrs and string is None:
+            for element in iterator:
+                if element.name == name:
+                    return element
+            return None
+
+        matches = self._build_matcher(name, attrs, string)
+        for element in iterator:
+            if matches(element):
+                return element
+        return None
 
     def find_all(
         self,
@@ -344,20 +635,12 @@ class Tag:
     ) -> List['Tag']:
         """Find all matching tags."""
         results = []
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
 
-        # Handle class_ argument
-        if 'class_' in attrs:
-            attrs['class'] = attrs.pop('class_')
-
-        iterator = self.descendants if recursive else self.children
-
-        for element in iterator:
-            if not isinstance(element, Tag):
-                continue
-
-            if self._matches(element, name, attrs, string):
+        matches = self._build_matcher(name, attrs, string)
+        for element in self._iter_candidate_tags(recursive):
+            if matches(element):
                 results.append(element)
                 if limit and len(results) >= limit:
                     break
@@ -371,12 +654,15 @@ class Tag:
         **kwargs
     ) -> Optional['Tag']:
         """Find the first matching parent."""
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+        matches = self._build_matcher(name, attrs)
 
-        for parent in self.parents:
-            if self._matches(parent, name, attrs):
+        parent = self.parent
+        while parent is not None:
+            if matches(parent):
                 return parent
+            parent = parent.parent
         return None
 
     def find_parents(
@@ -388,14 +674,17 @@ class Tag:
     ) -> List['Tag']:
         """Find all matching parents."""
         results = []
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+        matches = self._build_matcher(name, attrs)
 
-        for parent in self.parents:
-            if self._matches(parent, name, attrs):
+        parent = self.parent
+        while parent is not None:
+            if matches(parent):
                 results.append(parent)
                 if limit and len(results) >= limit:
                     break
+            parent = parent.parent
         return results
 
     def find_next_sibling(
@@ -405,12 +694,15 @@ class Tag:
         **kwargs
     ) -> Optional['Tag']:
         """Find the next matching sibling."""
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+        matches = self._build_matcher(name, attrs)
 
-        for sibling in self.next_siblings:
-            if isinstance(sibling, Tag) and self._matches(sibling, name, attrs):
+        sibling = self.next_sibling
+        while sibling is not None:
+            if isinstance(sibling, Tag) and matches(sibling):
                 return sibling
+            sibling = sibling.next_sibling
         return None
 
     def find_next_siblings(
@@ -422,14 +714,17 @@ class Tag:
     ) -> List['Tag']:
         """Find all next matching siblings."""
         results = []
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+        matches = self._build_matcher(name, attrs)
 
-        for sibling in self.next_siblings:
-            if isinstance(sibling, Tag) and self._matches(sibling, name, attrs):
+        sibling = self.next_sibling
+        while sibling is not None:
+            if isinstance(sibling, Tag) and matches(sibling):
                 results.append(sibling)
                 if limit and len(results) >= limit:
                     break
+            sibling = sibling.next_sibling
         return results
 
     def find_previous_sibling(
@@ -439,12 +734,15 @@ class Tag:
         **kwargs
     ) -> Optional['Tag']:
         """Find the previous matching sibling."""
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+        matches = self._build_matcher(name, attrs)
 
-        for sibling in self.previous_siblings:
-            if isinstance(sibling, Tag) and self._matches(sibling, name, attrs):
+        sibling = self.previous_sibling
+        while sibling is not None:
+            if isinstance(sibling, Tag) and matches(sibling):
                 return sibling
+            sibling = sibling.previous_sibling
         return None
 
     def find_previous_siblings(
@@ -456,14 +754,17 @@ class Tag:
     ) -> List['Tag']:
         """Find all previous matching siblings."""
         results = []
-        attrs = attrs or {}
-        attrs.update(kwargs)
+        attrs = self._normalize_query_attrs(attrs, kwargs)
+        name = self._normalize_name(name)
+        matches = self._build_matcher(name, attrs)
 
-        for sibling in self.previous_siblings:
-            if isinstance(sibling, Tag) and self._matches(sibling, name, attrs):
+        sibling = self.previous_sibling
+        while sibling is not None:
+            if isinstance(sibling, Tag) and matches(sibling):
                 results.append(sibling)
                 if limit and len(results) >= limit:
                     break
+            sibling = sibling.previous_sibling
         return results
 
     def select(self, selector: str) -> List['Tag']:
@@ -479,250 +780,263 @@ class Tag:
         """Parse and apply CSS selector."""
         results = []
 
-        # Split by comma for multiple selectors
-        selectors = [s.strip() for s in selector.split(',')]
-
-        for sel in selectors:
-            results.extend(self._apply_single_selector(sel))
-
-        # Remove duplicates while preserving order
+        # Apply each comma-separated selector; tags matched by an earlier
+        # selector are skipped as they are produced, so results stay unique
         seen = set()
-        unique_results = []
-        for tag in results:
-            if id(tag) not in seen:
-                seen.add(id(tag))
-                unique_results.append(tag)
+        for parts in _compile_selector(selector):
+            results.extend(self._apply_single_selector(parts, seen))
 
-        return unique_results
+        return results
 
-    def _apply_single_selector(self, selector: str) -> List['Tag']:
-        """Apply a single CSS selector."""
-        parts = selector.split()
+    def _apply_single_selector(
+        self,
+        parts: Tuple[SelectorPart, ...],
+        seen: Optional[set] = None
+    ) -> List['Tag']:
+        """
+        Apply a single pre-parsed CSS selector.
 
+        Tags already in seen are not considered, and matched tags are added
+        to it.
+        """
         if not parts:
             return []
 
-        # Start with all descendants or the root
-        current = list(self.descendants)
-        current = [e for e in current if isinstance(e, Tag)]
-
-        for part in parts:
-            if part == '>':
-                continue  # Handle in next iteration
+        # The first part filters the traversal directly, so the full list of
+        # descendants is never materialized
+        current = self._iter_descendant_tags()
+        if seen:
+            current = (tag for tag in current if tag not in seen)
 
+        filters = [part for part in parts if part.kind != 'combinator']
+        if not filters:
+            current = list(current)
+        for part in filters:
             current = self._filter_by_selector_part(current, part)
 
+        if seen is not None:
+            seen.update(current)
         return current
 
-    def _filter_by_selector_part(self, elements: List['Tag'], part: str) -> List['Tag']:
-        """Filter elements by a single selector part."""
+    def _filter_by_selector_part(self, elements: Iterable['Tag'], part: SelectorPart) -> List['Tag']:
+        """Filter elements by a single pre-parsed selector part."""
         results = []
+        kind = part.kind
+        tag_name = part.tag_name
 
-        # Parse the selector part
-        # Handle ID selector
-        if '#' in part:
-            tag_name, _, id_val = part.partition('#')
-            if '.' in id_val:
-                id_val, _, class_part = id_val.partition('.')
-                for elem in elements:
-                    if (not tag_name or elem.name == tag_name.lower()) and \
-                       elem.get('id') == id_val and \
-                       class_part in elem.get_attribute_list('class'):
-                        results.append(elem)
-            else:
-                for elem in elements:
-                    if (not tag_name or elem.name == tag_name.lower()) and \
-                       elem.get('id') == id_val:
-                        results.append(elem)
-
-        # Handle class selector
-        elif '.' in part:
-            parts = part.split('.')
-            tag_name = parts[0] if parts[0] else None
-            classes = parts[1:]
+        if kind == 'id':
+            id_val = part.id
+            for elem in elements:
+                if (not tag_name or elem.name == tag_name) and \
+                   (elem._attrs or _NO_ATTRS).get('id') == id_val and \
+                   all(c in elem._attribute_list('class') for c in part.classes):
+                    results.append(elem)
 
+        elif kind == 'class':
+            classes = part.classes
             for elem in elements:
-                if tag_name and elem.name != tag_name.lower():
+                if tag_name and elem.name != tag_name:
                     continue
-                elem_classes = elem.get_attribute_list('class')
+                elem_classes = elem._attribute_list('class')
                 if all(c in elem_classes for c in classes):
                     results.append(elem)
 
-        # Handle attribute selector
-        elif '[' in part:
-            match = re.match(r'(\w*)?\[([^\]]+)\]', part)
-            if match:
-                tag_name, attr_selector = match.groups()
-
-                # Parse attribute selector
-                if '=' in attr_selector:
-                    if '~=' in attr_selector:
-                        attr_name, attr_value = attr_selector.split('~=')
-                        attr_value = attr_value.strip('"\'')
-                        for elem in elements:
-                            if (not tag_name or elem.name == tag_name.lower()) and \
-                               attr_value in elem.get_attribute_list(attr_name):
-                                results.append(elem)
-                    elif '^=' in attr_selector:
-                        attr_name, attr_value = attr_selector.split('^=')
-                        attr_value = attr_value.strip('"\'')
-                        for elem in elements:
-                            if (not tag_name or elem.name == tag_name.lower()) and \
-                               str(elem.get(attr_name, '')).startswith(attr_value):
-                                results.append(elem)
-                    elif '$=' in attr_selector:
-                        attr_name, attr_value = attr_selector.split('$=')
-                        attr_value = attr_value.strip('"\'')
-                        for elem in elements:
-                            if (not tag_name or elem.name == tag_name.lower()) and \
-                               str(elem.get(attr_name, '')).endswith(attr_value):
-                                results.append(elem)
-                    elif '*=' in attr_selector:
-                        attr_name, attr_value = attr_selector.split('*=')
-                        attr_value = attr_value.strip('"\'')
-                        for elem in elements:
-                            if (not tag_name or elem.name == tag_name.lower()) and \
-                               attr_value in str(elem.get(attr_name, '')):
-                                results.append(elem)
-                    else:
-                        attr_name, attr_value = attr_selector.split('=')
-                        attr_value = attr_value.strip('"\'')
-                        for elem in elements:
-                            if (not tag_name or elem.name == tag_name.lower()) and \
-                               elem.get(attr_name) == attr_value:
-                                results.append(elem)
+        elif kind == 'attr':
+            op, attr_name, attr_value = part.attr_op, part.attr_name, part.attr_value
+            for elem in elements:
+                if tag_name and elem.name != tag_name:
+                    continue
+                elem_attrs = elem._attrs or _NO_ATTRS
+                if op is None:
+                    matched = attr_name in elem_attrs
+                elif op == '~=':
+                    matched = attr_value in elem._attribute_list(attr_name)
+                elif op == '^=':
+                    matched = str(elem_attrs.get(attr_name, '')).startswith(attr_value)
+                elif op == '$=':
+                    matched = str(elem_attrs.get(attr_name, '')).endswith(attr_value)
+                elif op == '*=':
+                    matched = attr_value in str(elem_attrs.get(attr_name, ''))
                 else:
-                    # Just checking for attribute existence
-                    for elem in elements:
-                        if (not tag_name or elem.name == tag_name.lower()) and \
-                           attr_selector in elem.attrs:
-                            results.append(elem)
+                    matched = elem_attrs.get(attr_name) == attr_value
+                if matched:
+                    results.append(elem)
 
-        # Handle tag name only
-        else:
-            tag_name = part.lower()
+        elif kind == 'tag':
             for elem in elements:
                 if elem.name == tag_name:
                     results.append(elem)
 
         return results
 
-    def _matches(
-        self,
-        tag: 'Tag',
-        name: Optional[Union[str, List[str], re.Pattern, Callable]] = None,
+    @staticmethod
+    def _normalize_query_attrs(
+        attrs: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge attrs and keyword filters into a new dict, never the caller's."""
+        query = dict(attrs) if attrs else {}
+        query.update(kwargs)
+        # Handle class_ argument
+        if 'class_' in query:
+            query['class'] = query.pop('class_')
+        return query
+
+    @staticmethod
+    def _normalize_name(
+        name: Optional[Union[str, List[str], re.Pattern, Callable]]
+    ) -> Optional[Union[str, frozenset, re.Pattern, Callable]]:
+        """Lower-case a name filter once, before it is compared against many tags."""
+        if isinstance(name, str):
+            return sys.intern(name.lower())
+        if isinstance(name, list):
+            # Set membership keeps list matching O(1) per tag
+            return frozenset(n.lower() for n in name)
+        return name
+
+    @staticmethod
+    def _build_matcher(
+        name: Optional[Union[str, frozenset, re.Pattern, Callable]] = None,
         attrs: Optional[Dict[str, Any]] = None,
         string: Optional[Union[str, re.Pattern]] = None
-    ) -> bool:
-        """Check if a tag matches the given criteria."""
+    ) -> Callable[['Tag'], bool]:
+        """
+        Build a predicate that checks if a tag matches the given criteria.
+
+        The type of each filter is inspected once here rather than once per
+        candidate tag. name must already be normalized with _normalize_name().
+        """
+        checks: List[Callable[['Tag'], bool]] = []
+
         # Check name
         if name is not None:
             if callable(name):
-                if not name(tag.name):
-                    return False
+                checks.append(lambda tag: name(tag.name))
             elif isinstance(name, re.Pattern):
-                if not name.search(tag.name):
-                    return False
-            elif isinstance(name, list):
-                if tag.name not in [n.lower() for n in name]:
-                    return False
+                name_search = name.search
+                checks.append(lambda tag: name_search(tag.name))
+            elif isinstance(name, frozenset):
+                checks.append(lambda tag: tag.name in name)
             elif isinstance(name, str):
-                if tag.name != name.lower():
-                    return False
+                checks.append(lambda tag: tag.name == name)
 
         # Check attrs
         if attrs:
             for key, value in attrs.items():
-                tag_value = tag.get(key)
-
-                if value is True:
-                    # Just check attribute exists
-                    if key not in tag.attrs:
-                        return False
-                elif value is False or value is None:
-                    # Check attribute doesn't exist
-                    if key in tag.attrs:
-                        return False
-                elif callable(value):
-                    if not value(tag_value):
-                        return False
-                elif isinstance(value, re.Pattern):
-                    if not tag_value or not value.search(str(tag_value)):
-                        return False
-                elif isinstance(value, list):
-                    # For class matching, check if all classes are present
-                    tag_classes = tag.get_attribute_list(key)
-                    if not all(v in tag_classes for v in value):
-                        return False
-                else:
-                    # Check for class membership or exact match
-                    if key == 'class':
-                        tag_classes = tag.get_attribute_list('class')
-                        if value not in tag_classes:
-                            return False
-                    elif tag_value != value:
-                        return False
+                checks.append(Tag._build_attr_check(key, value))
 
         # Check string content
         if string is not None:
-            tag_string = tag.string
-            if tag_string is None:
-                return False
             if isinstance(string, re.Pattern):
-                if not string.search(tag_string):
+                string_search = string.search
+                def check_string(tag: 'Tag') -> bool:
+                    tag_string = tag.string
+                    return tag_string is not None and bool(string_search(tag_string))
+            else:
+                def check_string(tag: 'Tag') -> bool:
+                    return tag.string == string
+            checks.append(check_string)
+
+        if not checks:
+            return lambda tag: True
+        if len(checks) == 1:
+            return checks[0]
+
+        def matches(tag: 'Tag') -> bool:
+            for check in checks:
+                if not check(tag):
                     return False
-            elif tag_string != string:
-                return False
-
-        return True
+            return True
+        return matches
+
+    @staticmethod
+    def _build_attr_check(key: str, value: Any) -> Callable[['Tag'], bool]:
+        """Build the predicate for a single attribute filter."""
+        if value is True:
+            # Just check attribute exists
+            return lambda tag: key in (tag._attrs or _NO_ATTRS)
+        if value is False or value is None:
+            # Check attribute doesn't exist
+            return lambda tag: key not in (tag._attrs or _NO_ATTRS)
+        if callable(value):
+            # Through get(): list values reach user code and may be mutated
+            return lambda tag: value(tag.get(key))
+        if isinstance(value, re.Pattern):
+            def check_pattern(tag: 'Tag') -> bool:
+                tag_value = (tag._attrs or _NO_ATTRS).get(key)
+                return bool(tag_value) and bool(value.search(str(tag_value)))
+            return check_pattern
+        if isinstance(value, list):
+            # For class matching, check if all classes are present
+            def check_all(tag: 'Tag') -> bool:
+                tag_classes = tag._attribute_list(key)
+                return all(v in tag_classes for v in value)
+            return check_all
+        # Check for class membership or exact match
+        if key == 'class':
+            return lambda tag: value in tag._attribute_list('class')
+        return lambda tag: (tag._attrs or _NO_ATTRS).get(key) == value
+
+    def _render_attrs(self) -> str:
+        """Render the attribute string, reusing the last result if unchanged."""
+        attrs_str = self._attrs_str
+        if attrs_str is None or self._attrs_exposed:
+            attr_parts = []
+            for key, value in (self._attrs or _NO_ATTRS).items():
+                if isinstance(value, list):
+                    value = ' '.join(value)
+                if value is True:
+                    attr_parts.append(f' {key}')
+                elif value is not False and value is not None:
+                    attr_parts.append(f' {key}="{value}"')
+            attrs_str = self._attrs_str = ''.join(attr_parts)
+        return attrs_str
 
     def decode(self, indent_level: int = 0, formatter: str = 'minimal') -> str:
         """Render the tag as a string."""
-        indent = '  ' * indent_level if formatter == 'pretty' else ''
-        newline = '\n' if formatter == 'pretty' else ''
-
-        # Build opening tag
-        attrs_str = ''
-        for key, value in self.attrs.items():
-            if isinstance(value, list):
-                value = ' '.join(value)
-            if value is True:
-                attrs_str += f' {key}'
-            elif value is not False and value is not None:
-                attrs_str += f' {key}="{value}"'
+        out: List[str] = []
+        self._decode_into(out, indent_level, formatter == 'pretty')
+        return ''.join(out)
+
+    def _decode_into(self, out: List[str], indent_level: int, pretty: bool) -> None:
+        """Append the rendered fragments of this tag to ``out``."""
+        indent = _indent(indent_level) if pretty else ''
+        newline = '\n' if pretty else ''
+
+        attrs_str = self._render_attrs()
 
         # Self-closing tags
         if self.name in self.SELF_CLOSING_TAGS and not self.contents:
-            return f'{indent}<{self.name}{attrs_str}/>{newline}'
+            out.append(f'{indent}<{self.name}{attrs_str}/>{newline}')
+            return
 
         # Opening tag
-        result = f'{indent}<{self.name}{attrs_str}>'
+        out.append(f'{indent}<{self.name}{attrs_str}>')
 
         # Contents
         if self.contents:
-            if formatter == 'pretty':
-                result += newline
+            if pretty:
+                out.append(newline)
+                child_indent = _indent(indent_level + 1)
                 for child in self.contents:
                     if isinstance(child, Tag):
-                        result += child.decode(indent_level + 1, formatter)
+                        child._decode_into(out, indent_level + 1, True)
                     else:
                         child_text = str(child).strip()
                         if child_text:
-                            result += f'{"  " * (indent_level + 1)}{child_text}{newline}'
-                result += indent
+                            out.append(f'{child_indent}{child_text}{newline}')
+                out.append(indent)
             else:
                 for child in self.contents:
                     if isinstance(child, Tag):
-                        result += child.decode(0, formatter)
+                        child._decode_into(out, 0, False)
                     else:
-                        result += str(child)
+                        out.append(str(child))
 
         # Closing tag
-        result += f'</{self.name}>'
-        if formatter == 'pretty':
-            result += newline
-
-        return result
+        out.append(f'</{self.name}>')
+        if pretty:
+            out.append(newline)
 
     def prettify(self, formatter: str = 'pretty') -> str:
         """Return a nicely formatted string representation."""
@@ -4,13 +4,26 @@ mybeautifulsoup.parser - HTML/XML parsing logic
 Uses Python's built-in html.parser for HTML parsing.
 """
 
+from functools import lru_cache
 from html.parser import HTMLParser
 from html.entities import html5
-from typing import Optional, List, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any
 import re
+import threading
 
 from .element import Tag, NavigableString, Comment
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; LXMLTreeBuilder falls back to html.parser
+    lxml_etree = None
+
+
+@lru_cache(maxsize=1024)
+def _lookup_entity(name: str) -> str:
+    """Resolve a named entity, leaving unknown ones as literal text."""
+    return html5.get(name + ';', f'&{name};')
+
 
 class TreeBuilder:
     """Base class for tree builders."""
@@ -21,6 +34,9 @@ class TreeBuilder:
     def __init__(self):
         self.soup = None
         self.root = None
+        # Optional SoupStrainer; only matching tags (and their subtrees)
+        # are added to the tree
+        self.parse_only = None
 
     def reset(self):
         """Reset the builder state."""
@@ -30,8 +46,13 @@ class TreeBuilder:
         """Initialize with a BeautifulSoup instance."""
         self.soup = soup
 
-    def feed(self, markup: str):
-        """Parse markup and build the tree."""
+    def feed(self, markup: str, root: Optional[Tag] = None):
+        """
+        Parse markup and build the tree.
+
+        If root is given, the parsed nodes are appended to it in place
+        and it is returned; otherwise a new '[document]' Tag is created.
+        """
         raise NotImplementedError
 
 
@@ -46,6 +67,11 @@ class HTMLTreeBuilder(TreeBuilder, HTMLParser):
         HTMLParser.__init__(self, convert_charrefs=False)
         self._tag_stack: List[Tag] = []
         self._current_tag: Optional[Tag] = None
+        # Set to the root while straining: text directly under it is
+        # outside every accepted subtree and is dropped
+        self._strained_root: Optional[Tag] = None
+        # Stack positions of the open tags, by name, innermost last
+        self._open_by_name: Dict[str, List[int]] = {}
 
     def reset(self):
         """Reset the parser state."""
@@ -53,15 +79,19 @@ class HTMLTreeBuilder(TreeBuilder, HTMLParser):
         HTMLParser.reset(self)
         self._tag_stack = []
         self._current_tag = None
+        self._strained_root = None
+        self._open_by_name = {}
 
-    def feed(self, markup: str) -> Tag:
+    def feed(self, markup: str, root: Optional[Tag] = None) -> Tag:
         """Parse HTML markup and return the root tag."""
         self.reset()
 
-        # Create root document tag
-        self.root = Tag(name='[document]')
+        # Build into the given root, or create a root document tag
+        self.root = root if root is not None else Tag(name='[document]')
         self._current_tag = self.root
         self._tag_stack = [self.root]
+        if self.parse_only is not None:
+            self._strained_root = self.root
 
         # Parse the markup
         try:
@@ -77,41 +107,56 @@ class HTMLTreeBuilder(TreeBuilder, HTMLParser):
 
     def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
         """Handle an opening tag."""
-        # Convert attrs to dict, handling multiple class values
-        attrs_dict = {}
-        for key, value in attrs:
-            if key == 'class' and value:
-                # Split class into list
-                attrs_dict[key] = value.split()
-            else:
-                attrs_dict[key] = value if value is not None else True
+        # Convert attrs to dict; valueless attributes become True
+        attrs_dict = {key: True if value is None else value for key, value in attrs}
+        # Split class into list, handling multiple class values
+        class_value = attrs_dict.get('class')
+        if class_value and isinstance(class_value, str):
+            attrs_dict['class'] = class_value.split()
+
+        current = self._current_tag
+
+        # With parse_only, a tag outside any accepted subtree is only kept
+        # if it matches; its children are still examined on their own.
+        # Only accepted tags are ever pushed, so "outside" means the
+        # current tag is the root.
+        if current is self._strained_root and not self.parse_only.search_tag(tag, attrs_dict):
+            return
 
-        new_tag = Tag(name=tag, attrs=attrs_dict, parent=self._current_tag)
+        new_tag = Tag._from_builder(tag, attrs_dict, current)
 
         # Add to parent's contents
-        self._append_to_current(new_tag)
+        if current is not None:
+            current.append(new_tag)
 
-        # Handle self-closing tags
-        if tag.lower() in Tag.SELF_CLOSING_TAGS:
+        # Handle self-closing tags (html.parser already lower-cases names)
+        if tag in Tag.SELF_CLOSING_TAGS:
             return
 
         # Push to stack for non-self-closing tags
-        self._tag_stack.append(new_tag)
+        stack = self._tag_stack
+        self._open_by_name.setdefault(tag, []).append(len(stack))
+        stack.append(new_tag)
         self._current_tag = new_tag
 
     def handle_endtag(self, tag: str):
         """Handle a closing tag."""
-        tag = tag.lower()
-
-        # Find matching opening tag in stack
-        for i in range(len(self._tag_stack) - 1, 0, -1):
-            if self._tag_stack[i].name == tag:
-                # Pop tags up to and including the matching one
-                self._tag_stack = self._tag_stack[:i]
-                self._current_tag = self._tag_stack[-1] if self._tag_stack else self.root
-                return
-
-        # No matching tag found - ignore
+        # Find the innermost matching opening tag; html.parser hands end
+        # tag names over already lower-cased
+        open_by_name = self._open_by_name
+        positions = open_by_name.get(tag)
+        if not positions:
+            return  # No matching tag found - ignore
+
+        # Pop tags up to and including the matching one, in place. Each
+        # closed tag is the innermost open tag of its name, so forgetting
+        # it is a pop from the end of its position list.
+        stack = self._tag_stack
+        i = positions[-1]
+        for j in range(len(stack) - 1, i - 1, -1):
+            open_by_name[stack[j].name].pop()
+        del stack[i:]
+        self._current_tag = stack[-1]
 
     def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
         """Handle a self-closing tag like <br/>."""
@@ -119,23 +164,23 @@ class HTMLTreeBuilder(TreeBuilder, HTMLParser):
 
     def handle_data(self, data: str):
         """Handle text data."""
-        if data:
-            text = NavigableString(data)
-            self._append_to_current(text)
+        if data and self._current_tag is not self._strained_root:
+            self._current_tag.append(NavigableString(data))
 
     def handle_comment(self, data: str):
         """Handle HTML comments."""
-        comment = Comment(data)
-        self._append_to_current(comment)
+        if self._current_tag is not self._strained_root:
+            self._current_tag.append(Comment(data))
 
     def handle_entityref(self, name: str):
         """Handle named entities like &nbsp;."""
-        char = html5.get(name + ';', f'&{name};')
-        text = NavigableString(char)
-        self._append_to_current(text)
+        if self._current_tag is not self._strained_root:
+            self._current_tag.append(NavigableString(_lookup_entity(name)))
 
     def handle_charref(self, name: str):
         """Handle numeric character references like &#65;."""
+        if self._current_tag is self._strained_root:
+            return
         try:
             if name.startswith(('x', 'X')):
                 char = chr(int(name[1:], 16))
@@ -144,8 +189,7 @@ class HTMLTreeBuilder(TreeBuilder, HTMLParser):
         except (ValueError, OverflowError):
             char = f'&#{name};'
 
-        text = NavigableString(char)
-        self._append_to_current(text)
+        self._current_tag.append(NavigableString(char))
 
     def handle_decl(self, decl: str):
         """Handle doctype declarations."""
@@ -156,15 +200,10 @@ class HTMLTreeBuilder(TreeBuilder, HTMLParser):
         """Handle processing instructions like <?xml ...?>."""
         pass
 
-    def _append_to_current(self, element):
-        """Append an element to the current tag."""
-        if self._current_tag is not None:
-            self._current_tag.append(element)
-
 
 class LXMLTreeBuilder(TreeBuilder):
     """
-    Tree builder using lxml (placeholder).
+    Tree builder using lxml's C HTML parser.
     Falls back to html.parser if lxml is not available.
     """
 
@@ -174,15 +213,83 @@ class LXMLTreeBuilder(TreeBuilder):
     def __init__(self):
         super().__init__()
         self._html_builder = HTMLTreeBuilder()
+        self._lxml_parser = None
 
     def reset(self):
         super().reset()
         self._html_builder.reset()
 
-    def feed(self, markup: str) -> Tag:
+    def feed(self, markup: str, root: Optional[Tag] = None) -> Tag:
         """Parse using lxml or fallback to html.parser."""
-        # For now, just use html.parser as fallback
-        return self._html_builder.feed(markup)
+        if lxml_etree is not None:
+            try:
+                data = markup.encode('utf-8')
+            except UnicodeEncodeError:
+                # Lone surrogates cannot reach libxml2 intact; html.parser
+                # keeps them as-is
+                data = None
+        if lxml_etree is None or data is None:
+            self._html_builder.parse_only = self.parse_only
+            return self._html_builder.feed(markup, root)
+
+        if self._lxml_parser is None:
+            # The markup is already decoded, so it is handed over as UTF-8
+            # and any <meta charset> in the document is ignored
+            self._lxml_parser = lxml_etree.HTMLParser(encoding='utf-8')
+
+        self.root = root if root is not None else Tag(name='[document]')
+        try:
+            tree = lxml_etree.fromstring(data, parser=self._lxml_parser)
+        except lxml_etree.XMLSyntaxError:
+            tree = None  # Empty or unparseable document
+
+        if tree is not None:
+            # Comments outside <html> are siblings of the root element
+            preceding = list(tree.itersiblings(preceding=True))
+            for node in reversed(preceding):
+                self._build_from_lxml(node, self.root)
+            self._build_from_lxml(tree, self.root)
+            for node in tree.itersiblings():
+                self._build_from_lxml(node, self.root)
+        return self.root
+
+    def _build_from_lxml(self, element, parent: Tag):
+        """Translate an lxml element (and its descendants) into Tags under parent."""
+        # With parse_only, nodes directly under the root lie outside every
+        # accepted subtree (see HTMLTreeBuilder.handle_starttag)
+        strained_root = self.root if self.parse_only is not None else None
+        stack = [(element, parent)]
+        while stack:
+            node, parent = stack.pop()
+            if isinstance(node, str):
+                # Tail text, scheduled to follow the element it trails
+                if parent is not strained_root:
+                    parent.append(NavigableString(node))
+                continue
+
+            if isinstance(node.tag, str):
+                attrs = dict(node.attrib)
+                if attrs.get('class'):
+                    attrs['class'] = attrs['class'].split()
+                if parent is strained_root and not self.parse_only.search_tag(node.tag, attrs):
+                    # Skip the tag itself; its children are examined in turn
+                    tag = parent
+                else:
+                    tag = Tag._from_builder(node.tag, attrs, parent)
+                    parent.append(tag)
+                    if node.text:
+                        tag.append(NavigableString(node.text))
+                for child in reversed(node):
+                    if child.tail:
+                        stack.append((child.tail, tag))
+                    stack.append((child, tag))
+            elif node.tag is lxml_etree.Comment:
+                text = node.text or ''
+                # libxml2 turns <?...?> into a bogus "?...?" comment
+                if parent is not strained_root and not text.startswith('?'):
+                    parent.append(Comment(text))
+            # Processing instructions and entities are dropped, as in
+            # HTMLTreeBuilder
 
 
 class XMLTreeBuilder(TreeBuilder):
@@ -199,10 +306,11 @@ class XMLTreeBuilder(TreeBuilder):
         super().reset()
         self._html_builder.reset()
 
-    def feed(self, markup: str) -> Tag:
+    def feed(self, markup: str, root: Optional[Tag] = None) -> Tag:
         """Parse XML markup."""
         # Use html.parser with some XML adjustments
-        return self._html_builder.feed(markup)
+        self._html_builder.parse_only = self.parse_only
+        return self._html_builder.feed(markup, root)
 
 
 # Registry of available parsers
@@ -215,17 +323,40 @@ PARSERS = {
 }
 
 
+# Builders are pooled per thread and reused via reset(): constructing an
+# HTMLParser is not free, but its parse state must never be shared between
+# threads. A builder is therefore only safe to use from the thread that
+# obtained it, and only for one document at a time.
+_BUILDER_POOL = threading.local()
+
+
+def _pooled_builder(builder_class):
+    """Return this thread's instance of builder_class, creating it once."""
+    builders = getattr(_BUILDER_POOL, 'builders', None)
+    if builders is None:
+        builders = _BUILDER_POOL.builders = {}
+    builder = builders.get(builder_class)
+    if builder is None:
+        builder = builders[builder_class] = builder_class()
+    return builder
+
+
 def get_tree_builder(features=None):
-    """Get the best available tree builder for the given features."""
+    """
+    Get the best available tree builder for the given features.
+
+    The returned builder is shared with later calls from the same thread.
+    """
     if features is None:
-        features = ['html.parser']
+        # Prefer the C parser when lxml is installed
+        features = ['lxml'] if lxml_etree is not None else ['html.parser']
 
     if isinstance(features, str):
         features = [features]
 
     for feature in features:
         if feature in PARSERS:
-            return PARSERS[feature]()
+            return _pooled_builder(PARSERS[feature])
 
     # Default to html.parser
-    return HTMLTreeBuilder()
+    return _pooled_builder(HTMLTreeBuilder)
@@ -5,11 +5,21 @@ Provides the main BeautifulSoup class for parsing and navigating HTML/XML docume
 """
 
 from typing import Optional, Union, List, Any, Iterator
+import codecs
 import re
 
 from .element import Tag, NavigableString, Comment
 from .parser import get_tree_builder, HTMLTreeBuilder
 
+# Checked in order; the UTF-32 marks must come before their UTF-16 prefixes
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
 
 class BeautifulSoup(Tag):
     """
@@ -21,7 +31,8 @@ class BeautifulSoup(Tag):
     """
 
     ROOT_TAG_NAME = '[document]'
-    DEFAULT_BUILDER_FEATURES = ['html.parser']
+    # None lets get_tree_builder pick lxml when installed, else html.parser
+    DEFAULT_BUILDER_FEATURES = None
 
     def __init__(
         self,
@@ -42,7 +53,8 @@ class BeautifulSoup(Tag):
         markup : str or bytes
             The HTML/XML content to parse
         features : str or list
-            Parser to use: 'html.parser', 'lxml', 'lxml-xml', 'xml'
+            Parser to use: 'html.parser', 'lxml', 'lxml-xml', 'xml'.
+            Defaults to 'lxml' when lxml is installed, else 'html.parser'
         builder : TreeBuilder, optional
             A custom tree builder instance
         parse_only : SoupStrainer, optional
@@ -86,35 +98,46 @@ class BeautifulSoup(Tag):
             except (UnicodeDecodeError, LookupError):
                 pass
 
-        # Try common encodings
-        encodings = ['utf-8', 'latin-1', 'windows-1252', 'ascii']
-
-        for enc in encodings:
-            try:
-                result = markup.decode(enc)
-                self.original_encoding = enc
-                return result
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        # Last resort: decode with replacement
-        self.contains_replacement_characters = True
-        return markup.decode('utf-8', errors='replace')
+        # A byte order mark identifies the encoding outright
+        for bom, enc in _BOM_ENCODINGS:
+            if markup.startswith(bom):
+                try:
+                    result = markup.decode(enc)
+                    self.original_encoding = enc
+                    return result
+                except UnicodeDecodeError:
+                    break
+
+        # UTF-8 covers nearly all web content
+        try:
+            result = markup.decode('utf-8')
+            self.original_encoding = 'utf-8'
+            return result
+        except UnicodeDecodeError:
+            pass
+
+        # latin-1 maps every byte, so it cannot fail
+        self.original_encoding = 'latin-1'
+        return markup.decode('latin-1')
 
     def _feed(self, markup: str):
         """Feed markup to the parser and build the tree."""
         self.builder.reset()
 
-        # Parse the markup
-        root = self.builder.feed(markup)
+        # Parse the markup straight into this soup object
+        self.builder.parse_only = self.parse_only
+        root = self.builder.feed(markup, root=self)
 
-        # Copy the parsed tree to this soup object
-        if root is not None:
+        # Builders that ignore root hand back their own tree; adopt its nodes
+        if root is not None and root is not self:
             self.contents = root.contents
             for child in self.contents:
                 child.parent = self
             self._update_sibling_links()
 
+        # Builders are pooled, so drop their references to this document
+        self.builder.reset()
+
     def reset(self):
         """Reset the soup, removing all parsed content."""
         self.contents.clear()
@@ -151,10 +174,12 @@ class BeautifulSoup(Tag):
 
     def decode(self, indent_level: int = 0, formatter: str = 'minimal') -> str:
         """Render the soup as a string."""
-        result = []
+        # Every tag renders into the same list, joined once at the end
+        result: List[str] = []
+        pretty = formatter == 'pretty'
         for child in self.contents:
             if isinstance(child, Tag):
-                result.append(child.decode(indent_level, formatter))
+                child._decode_into(result, indent_level, pretty)
             else:
                 result.append(str(child))
         return ''.join(result)
@@ -30,16 +30,19 @@ def clear_line(mode=2):
     return CSI + str(mode) + 'K'
 
 
-class AnsiCodes:
-    """Base class for ANSI code containers"""
+class _AnsiMeta(type):
+    """Metaclass that turns integer class attributes into escape sequences"""
+
+    def __new__(mcs, name, bases, namespace):
+        # Converted once, when the class is created, and stored on the class
+        for key, value in list(namespace.items()):
+            if not key.startswith('_') and isinstance(value, int):
+                namespace[key] = code_to_chars(value)
+        return super().__new__(mcs, name, bases, namespace)
 
-    def __init__(self):
-        # Convert all class attributes to escape sequences
-        for name in dir(self):
-            if not name.startswith('_'):
-                value = getattr(self, name)
-                if isinstance(value, int):
-                    setattr(self, name, code_to_chars(value))
+
+class AnsiCodes(metaclass=_AnsiMeta):
+    """Base class for ANSI code containers"""
 
 
 class AnsiFore(AnsiCodes):
@@ -125,8 +128,8 @@ class AnsiCursor:
         return CSI + str(y) + ';' + str(x) + 'H'
 
 
-# Create singleton instances
-Fore = AnsiFore()
-Back = AnsiBack()
-Style = AnsiStyle()
+# The code containers are used as classes; their attributes are already strings
+Fore = AnsiFore
+Back = AnsiBack
+Style = AnsiStyle
 Cursor = AnsiCursor()
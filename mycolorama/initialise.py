@@ -8,7 +8,9 @@ On other platforms, this is largely a no-op.
 
 import sys
 import os
+import re
 import atexit
+from functools import lru_cache
 
 # Track initialization state
 _initialized = False
@@ -16,14 +18,37 @@ _original_stdout = None
 _original_stderr = None
 _wrap_enabled = True
 
+# ANSI CSI sequences such as '\033[31m', compiled once rather than per write()
+_ANSI_RE = re.compile(r'\033\[[0-9;]*[A-Za-z]')
+
+# Stream attributes that never change for a given stream. Copying them onto
+# the wrappers keeps hot lookups (logging, print) off __getattr__. 'closed'
+# is left out on purpose, since it changes over the stream's lifetime.
+_FORWARDED_STREAM_ATTRS = ('encoding', 'errors', 'mode', 'buffer', 'isatty', 'fileno')
+
+
+def _forward_stream_attributes(wrapper, wrapped):
+    """Copy the static attributes of wrapped that exist onto wrapper"""
+    for name in _FORWARDED_STREAM_ATTRS:
+        try:
+            setattr(wrapper, name, getattr(wrapped, name))
+        except AttributeError:
+            pass
+
 
 def _is_windows():
     """Check if running on Windows"""
     return sys.platform.startswith('win') or os.name == 'nt'
 
 
+@lru_cache(maxsize=1)
 def _supports_ansi():
-    """Check if the terminal supports ANSI escape codes natively"""
+    """
+    Check if the terminal supports ANSI escape codes natively.
+
+    The answer is cached for the process. On Windows the check imports
+    ctypes and enables VT processing, which only needs to happen once.
+    """
     # Check for common indicators of ANSI support
     if os.environ.get('TERM'):
         return True
@@ -64,6 +89,7 @@ class AnsiToWin32:
         self.autoreset = autoreset
         self._convert = convert
         self._strip = strip
+        _forward_stream_attributes(self, wrapped)
 
         # Determine conversion behavior
         if convert is None:
@@ -94,9 +120,10 @@ class AnsiToWin32:
 
     def _strip_ansi(self, text):
         """Remove ANSI escape sequences from text"""
-        import re
-        ansi_pattern = re.compile(r'\033\[[0-9;]*[A-Za-z]')
-        return ansi_pattern.sub('', text)
+        # Most writes carry no escape codes; skip the regex for those
+        if '\033' not in text:
+            return text
+        return _ANSI_RE.sub('', text)
 
     def flush(self):
         """Flush the wrapped stream"""
@@ -115,6 +142,7 @@ class StreamWrapper:
         self.wrapped = wrapped
         self.autoreset = autoreset
         self._stream = wrapped
+        _forward_stream_attributes(self, wrapped)
 
     def write(self, text):
         self.wrapped.write(text)
@@ -3,8 +3,10 @@ Date parsing utilities for feedparser.
 Handles RFC 822, ISO 8601, and various other date formats.
 """
 
+import calendar
 import re
 import time
+from functools import lru_cache
 from email.utils import parsedate_tz, mktime_tz
 
 # Month name mappings
@@ -42,7 +44,11 @@ RFC822_RE = re.compile(
     re.IGNORECASE
 )
 
+# Every supported format contains at least one digit
+DIGIT_RE = re.compile(r"\d")
 
+
+@lru_cache(maxsize=4096)
 def _parse_date(date_string):
     """
     Parse a date string into a time.struct_time.
@@ -57,12 +63,29 @@ def _parse_date(date_string):
 
     Returns:
         time.struct_time or None if parsing fails
+
+    Results are memoized, since entries in a feed (and repeated fetches of
+    the same feed) often share date strings.
     """
     if not date_string:
         return None
 
     date_string = date_string.strip()
 
+    # Cheap rejection before any real parsing; the shortest valid form is
+    # a bare ISO 8601 year
+    if len(date_string) < 4 or not DIGIT_RE.search(date_string):
+        return None
+
+    # Atom and most modern feeds use ISO 8601 ("2024-01-31..."); sniff the
+    # leading year so those skip the email.utils attempt
+    looks_iso = (len(date_string) >= 10 and date_string[4] == "-"
+                 and date_string[:4].isdigit())
+    if looks_iso:
+        result = _parse_iso8601(date_string)
+        if result:
+            return result
+
     # Try email.utils first (handles RFC 822 well)
     try:
         parsed = parsedate_tz(date_string)
@@ -73,9 +96,10 @@ def _parse_date(date_string):
         pass
 
     # Try ISO 8601
-    result = _parse_iso8601(date_string)
-    if result:
-        return result
+    if not looks_iso:
+        result = _parse_iso8601(date_string)
+        if result:
+            return result
 
     # Try RFC 822 manually
     result = _parse_rfc822(date_string)
@@ -108,25 +132,19 @@ def _parse_iso8601(date_string):
     second = int(groups[5]) if groups[5] else 0
     tz_str = groups[7]
 
-    # Calculate timezone offset
+    # Calculate timezone offset. ISO8601_RE only captures "Z", "+HH:MM"
+    # or "+HHMM", so the offset digits can be sliced directly
     tz_offset = 0
-    if tz_str:
-        if tz_str.upper() == "Z":
-            tz_offset = 0
-        elif tz_str[0] in "+-":
-            sign = 1 if tz_str[0] == "+" else -1
-            tz_clean = tz_str[1:].replace(":", "")
-            if len(tz_clean) >= 2:
-                hours = int(tz_clean[:2])
-                minutes = int(tz_clean[2:4]) if len(tz_clean) >= 4 else 0
-                tz_offset = sign * (hours * 3600 + minutes * 60)
+    if tz_str and tz_str != "Z" and tz_str != "z":
+        sign = 1 if tz_str[0] == "+" else -1
+        hours = int(tz_str[1:3])
+        minutes = int(tz_str[-2:])
+        tz_offset = sign * (hours * 3600 + minutes * 60)
 
     try:
-        # Create time tuple
-        timestamp = time.mktime((year, month, day, hour, minute, second, 0, 0, -1))
-        # Adjust for timezone
+        # Treat the fields as UTC, then adjust for the stated offset
+        timestamp = calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
         timestamp -= tz_offset
-        timestamp -= time.timezone  # Adjust for local timezone
         return time.gmtime(timestamp)
     except (ValueError, OverflowError):
         return None
@@ -174,9 +192,8 @@ def _parse_rfc822(date_string):
             tz_offset = sign * (hours * 3600 + minutes * 60)
 
     try:
-        timestamp = time.mktime((year, month, day, hour, minute, second, 0, 0, -1))
+        timestamp = calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
         timestamp -= tz_offset
-        timestamp -= time.timezone
         return time.gmtime(timestamp)
     except (ValueError, OverflowError):
         return None
@@ -2,13 +2,26 @@
 Data models for feedparser.
 """
 
+import sys
+
+# MIME types and link relations that recur in every detail/link dict;
+# interned so a parsed feed shares one object per value
+_TEXT_PLAIN = sys.intern("text/plain")
+_TEXT_HTML = sys.intern("text/html")
+_ALTERNATE = sys.intern("alternate")
+_ENCLOSURE = sys.intern("enclosure")
+
 
 class FeedParserDict(dict):
     """
     A dict-like object that allows attribute access.
     Used for feed, entries, and result objects.
+
+    Attributes map onto the dict items, so instances carry no __dict__.
     """
 
+    __slots__ = ()
+
     def __getattr__(self, key):
         try:
             return self[key]
@@ -24,15 +37,8 @@ class FeedParserDict(dict):
         except KeyError:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
 
-    def get(self, key, default=None):
-        """Get item with default."""
-        try:
-            return self[key]
-        except KeyError:
-            return default
-
 
-def make_detail(value, type_="text/plain", language=None, base=None):
+def make_detail(value, type_=_TEXT_PLAIN, language=None, base=None):
     """
     Create a detail dict for title_detail, summary_detail, etc.
 
@@ -55,7 +61,7 @@ def make_detail(value, type_="text/plain", language=None, base=None):
     return detail
 
 
-def make_link(href, rel="alternate", type_=None, title=None, length=None):
+def make_link(href, rel=_ALTERNATE, type_=None, title=None, length=None):
     """
     Create a link dict.
 
@@ -119,10 +125,7 @@ def make_tag(term, scheme=None, label=None):
     tag["term"] = term
     if scheme:
         tag["scheme"] = scheme
-    if label:
-        tag["label"] = label
-    else:
-        tag["label"] = term
+    tag["label"] = label or term
     return tag
 
 
@@ -147,7 +150,7 @@ def make_enclosure(href, type_=None, length=None):
     return enc
 
 
-def make_content(value, type_="text/html", language=None, base=None):
+def make_content(value, type_=_TEXT_HTML, language=None, base=None):
     """
     Create a content dict for entry content.
 
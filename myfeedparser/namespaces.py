@@ -33,6 +33,9 @@ NAMESPACES = {
     "xml": "http://www.w3.org/XML/1998/namespace",
 }
 
+# Reverse mapping for get_namespace_prefix
+_NAMESPACES_REVERSE = {uri: prefix for prefix, uri in NAMESPACES.items()}
+
 # Feed version detection patterns
 VERSION_PATTERNS = {
     "rss20": [
@@ -68,18 +71,9 @@ def detect_feed_version(root_tag, root_attribs):
     Returns:
         Feed version string (rss20, atom10, etc.) or empty string
     """
-    # Check for Atom first (namespaced)
-    if "atom" in root_tag.lower() or "{http://www.w3.org/2005/Atom}" in root_tag:
-        return "atom10"
-    if "{http://purl.org/atom/ns#}" in root_tag:
-        return "atom03"
-
-    # Check for RDF/RSS 1.0
-    if "rdf" in root_tag.lower() or "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}" in root_tag:
-        return "rss10"
-
-    # Check for RSS 2.0/0.9x
-    if root_tag.lower() == "rss":
+    # RSS 2.0/0.9x is by far the most common, so check it first.
+    # Tags are case-sensitive in XML, so compare them exactly.
+    if root_tag == "rss":
         version = root_attribs.get("version", "2.0")
         if version.startswith("2"):
             return "rss20"
@@ -91,6 +85,16 @@ def detect_feed_version(root_tag, root_attribs):
             return "rss090"
         return "rss20"  # Default to RSS 2.0
 
+    # Atom (namespaced)
+    if root_tag.startswith("{http://www.w3.org/2005/Atom}"):
+        return "atom10"
+    if root_tag.startswith("{http://purl.org/atom/ns#}"):
+        return "atom03"
+
+    # RDF/RSS 1.0
+    if root_tag.startswith("{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"):
+        return "rss10"
+
     return ""
 
 
@@ -104,10 +108,7 @@ def get_namespace_prefix(uri):
     Returns:
         Prefix string or None
     """
-    for prefix, ns_uri in NAMESPACES.items():
-        if ns_uri == uri:
-            return prefix
-    return None
+    return _NAMESPACES_REVERSE.get(uri)
 
 
 def strip_namespace(tag):
@@ -3,7 +3,14 @@ Main feed parsing logic.
 """
 
 import io
-import xml.etree.ElementTree as ET
+import sys
+from functools import lru_cache
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 
@@ -15,11 +22,121 @@ from .models import (
     make_tag,
     make_enclosure,
     make_content,
+    _ALTERNATE,
+    _ENCLOSURE,
 )
 from .dates import _parse_date
 from .namespaces import detect_feed_version, strip_namespace, NAMESPACES
 from .sanitizer import sanitize_html, strip_tags, detect_content_type
 
+# Namespaced tag names, built once instead of on every lookup
+_ATOM_TAG_NAMES = (
+    "title", "link", "subtitle", "tagline", "id", "updated", "modified",
+    "author", "generator", "rights", "category", "entry", "summary",
+    "content", "published", "issued", "contributor", "name", "email", "uri",
+)
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_TAGS = {name: _ATOM_NS + name for name in _ATOM_TAG_NAMES}
+_ATOM03_NS = "{http://purl.org/atom/ns#}"
+_ATOM03_TAGS = {name: _ATOM03_NS + name for name in _ATOM_TAG_NAMES}
+_RSS10_CHANNEL = "{http://purl.org/rss/1.0/}channel"
+_RSS10_ITEM = "{http://purl.org/rss/1.0/}item"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+
+# RSS items are parsed and released as soon as they close while streaming
+_RSS_ITEM_TAGS = ("item", _RSS10_ITEM)
+
+# Bytes read up front from a feed stream to sniff its XML declaration
+_HEAD_SIZE = 512
+
+
+class _HeadedStream:
+    """
+    Read-only binary stream that replays an already-read head before
+    reading on from the underlying stream.
+    """
+
+    def __init__(self, head, stream):
+        self._head = head
+        self._stream = stream
+
+    def read(self, size=-1):
+        head = self._head
+        if not head:
+            return self._stream.read(size)
+        if size is None or size < 0:
+            self._head = b""
+            return head + self._stream.read()
+        self._head = head[size:]
+        return head[:size]
+
+
+@lru_cache(maxsize=64)
+def _atom_type(type_):
+    """
+    Map an Atom type attribute to the MIME type used in detail dicts.
+
+    Feeds repeat the same few values, so each maps to one shared,
+    interned string.
+    """
+    return sys.intern(f"text/{type_}" if "/" not in type_ else type_)
+
+
+def _index_children(elem):
+    """
+    Group the children of an element by tag in a single pass.
+
+    Returns a dict mapping each tag to its child elements in document
+    order, so repeated lookups don't rescan the children.
+    """
+    index = {}
+    for child in elem:
+        found = index.get(child.tag)
+        if found is None:
+            index[child.tag] = [child]
+        else:
+            found.append(child)
+    return index
+
+
+def _first_child(children, *tags):
+    """
+    Get the first child for the first of tags present in an index.
+    """
+    for tag in tags:
+        found = children.get(tag)
+        if found:
+            return found[0]
+    return None
+
+
+def _all_children(children, *tags):
+    """
+    Get all children for the first of tags present in an index.
+    """
+    for tag in tags:
+        found = children.get(tag)
+        if found:
+            return found
+    return []
+
+
+def _element_text(elem):
+    """
+    Get the stripped text of an element, or None if it has none.
+    """
+    if elem is not None and elem.text:
+        return elem.text.strip()
+    return None
+
+
+def _child_text(children, *tags):
+    """
+    Get the stripped text of the first matching child in an index.
+    """
+    return _element_text(_first_child(children, *tags))
+
 
 class FeedParser:
     """
@@ -28,16 +145,16 @@ class FeedParser:
 
     def __init__(self):
         self.result = FeedParserDict()
-        self.result.feed = FeedParserDict()
-        self.result.entries = []
-        self.result.bozo = 0
-        self.result.bozo_exception = None
-        self.result.headers = FeedParserDict()
-        self.result.href = ""
-        self.result.status = 0
-        self.result.encoding = "utf-8"
-        self.result.version = ""
-        self.result.namespaces = {}
+        self.result["feed"] = FeedParserDict()
+        self.result["entries"] = []
+        self.result["bozo"] = 0
+        self.result["bozo_exception"] = None
+        self.result["headers"] = FeedParserDict()
+        self.result["href"] = ""
+        self.result["status"] = 0
+        self.result["encoding"] = "utf-8"
+        self.result["version"] = ""
+        self.result["namespaces"] = {}
 
     def parse(self, source, etag=None, modified=None, agent=None,
               handlers=None, request_headers=None):
@@ -58,31 +175,34 @@ class FeedParser:
         data = None
 
         # Determine source type and get data
-        if hasattr(source, "read"):
+        if isinstance(source, (bytes, bytearray)):
+            # Already-loaded XML document
+            data = bytes(source)
+        elif hasattr(source, "read"):
             # File-like object
             data = source.read()
             if isinstance(data, str):
                 data = data.encode("utf-8")
-        elif source.startswith(("http://", "https://")):
-            # URL
-            data = self._fetch_url(source, etag, modified, agent, request_headers)
-        elif source.startswith("<?xml") or source.startswith("<rss") or source.startswith("<feed"):
-            # XML string
-            if isinstance(source, str):
+        elif source[:7] == "http://" or source[:8] == "https://":
+            # URL; the body is parsed as it is read off the socket
+            response = self._fetch_url(source, etag, modified, agent, request_headers)
+            if response is not None:
+                with response:
+                    self._parse_xml_stream(response)
+            return self.result
+        else:
+            head = source[:32].lstrip()
+            if head[:5] == "<?xml" or head[:4] == "<rss" or head[:5] == "<feed":
+                # XML string
                 data = source.encode("utf-8")
             else:
-                data = source
-        else:
-            # Try as file path
-            try:
-                with open(source, "rb") as f:
-                    data = f.read()
-            except (IOError, OSError):
-                # Treat as XML string
-                if isinstance(source, str):
+                # Try as file path
+                try:
+                    with open(source, "rb") as f:
+                        data = f.read()
+                except (IOError, OSError, ValueError):
+                    # Treat as XML string
                     data = source.encode("utf-8")
-                else:
-                    data = source
 
         if data is None:
             return self.result
@@ -93,9 +213,12 @@ class FeedParser:
 
     def _fetch_url(self, url, etag=None, modified=None, agent=None, request_headers=None):
         """
-        Fetch feed content from URL.
+        Open a feed URL.
+
+        Returns the response, left open for the caller to stream, or None
+        if the request failed.
         """
-        self.result.href = url
+        self.result["href"] = url
         headers = {}
 
         if agent:
@@ -114,342 +237,421 @@ class FeedParser:
 
         try:
             response = urlopen(request, timeout=30)
-            self.result.status = response.status
+            self.result["status"] = response.status
 
             # Store headers
-            for key, value in response.headers.items():
-                self.result.headers[key.lower()] = value
+            self.result["headers"].update({key.lower(): value for key, value in response.headers.items()})
 
             # Check for redirects
-            self.result.href = response.url
+            self.result["href"] = response.url
 
             # Get encoding
             content_type = response.headers.get("Content-Type", "")
             if "charset=" in content_type:
-                self.result.encoding = content_type.split("charset=")[1].split(";")[0].strip()
+                self.result["encoding"] = content_type.split("charset=")[1].split(";")[0].strip()
 
-            return response.read()
+            return response
 
         except HTTPError as e:
-            self.result.status = e.code
-            self.result.bozo = 1
-            self.result.bozo_exception = e
+            self._handle_http_error(e)
             return None
         except URLError as e:
-            self.result.bozo = 1
-            self.result.bozo_exception = e
+            self._set_bozo(e)
             return None
 
+    def _handle_http_error(self, error):
+        """
+        Record a failed HTTP response.
+        """
+        self.result["status"] = error.code
+        self._set_bozo(error)
+
+    def _set_bozo(self, exception):
+        """
+        Flag the result as malformed/failed with the given exception.
+        """
+        self.result["bozo"] = 1
+        self.result["bozo_exception"] = exception
+
     def _parse_xml(self, data):
         """
         Parse XML data into feed structure.
         """
+        self._parse_xml_stream(io.BytesIO(data))
+
+    def _parse_xml_stream(self, stream):
+        """
+        Parse XML read from a binary file-like object into feed structure.
+        """
         try:
-            # Handle encoding declaration
-            if isinstance(data, bytes):
-                # Try to detect encoding from XML declaration
-                if data.startswith(b"<?xml"):
-                    decl_end = data.find(b"?>")
-                    if decl_end > 0:
-                        decl = data[:decl_end].decode("ascii", errors="ignore")
-                        if 'encoding="' in decl:
-                            enc = decl.split('encoding="')[1].split('"')[0]
-                            self.result.encoding = enc
-                        elif "encoding='" in decl:
-                            enc = decl.split("encoding='")[1].split("'")[0]
-                            self.result.encoding = enc
-
-            root = ET.fromstring(data)
-
-            # Detect version
-            self.result.version = detect_feed_version(root.tag, root.attrib)
-
-            # Extract namespaces
-            self._extract_namespaces(root)
-
-            # Parse based on feed type
-            if self.result.version.startswith("atom"):
-                self._parse_atom(root)
-            else:
-                self._parse_rss(root)
+            head = stream.read(_HEAD_SIZE)
+
+            # Detect encoding from the XML declaration, scanning the raw
+            # bytes so the declaration never has to be decoded
+            if head[:5] == b"<?xml":
+                decl_end = head.find(b"?>")
+                if decl_end > 0:
+                    for marker, quote in ((b'encoding="', b'"'), (b"encoding='", b"'")):
+                        start = head.find(marker, 0, decl_end)
+                        if start > 0:
+                            start += len(marker)
+                            end = head.find(quote, start, decl_end)
+                            if end < 0:
+                                end = decl_end
+                            self.result["encoding"] = head[start:end].decode("ascii", errors="ignore")
+                            break
+
+            self._parse_stream(_HeadedStream(head, stream))
 
         except ET.ParseError as e:
-            self.result.bozo = 1
-            self.result.bozo_exception = e
+            self._set_bozo(e)
+
+    def _parse_stream(self, stream):
+        """
+        Incrementally parse an XML stream into feed structure.
+
+        The root start tag decides the feed version. Each item/entry is
+        parsed as soon as its end tag arrives and then cleared, so only
+        the channel/feed metadata stays in memory for the whole parse.
+        Malformed feeds keep whatever was parsed before the error and
+        are flagged as bozo.
+        """
+        if _HAVE_LXML:
+            # libxml2's depth and text-size limits stay on: feeds are untrusted
+            events = ET.iterparse(stream, events=("start", "end"),
+                                  recover=True, resolve_entities=False)
+        else:
+            events = ET.iterparse(stream, events=("start", "end"))
+
+        root = None
+        atom_tags = None
+        entry_tag = None
+        depth = 0
+        # Parsed entries keyed by item/entry tag, one list per tag the
+        # feed type allows; the finishing step decides which variant of
+        # RSS item the feed actually uses.
+        streamed = {tag: [] for tag in _RSS_ITEM_TAGS}
+        # (tag, slot) of each RSS item still open, innermost last. Slots
+        # are reserved when an item starts so that items nested in other
+        # items keep document order.
+        open_items = []
+
+        try:
+            for event, elem in events:
+                if event == "start":
+                    if root is None:
+                        root = elem
+                        self.result["version"] = detect_feed_version(elem.tag, elem.attrib)
+                        self._extract_namespaces(elem)
+                        if self.result["version"] == "atom03":
+                            atom_tags = _ATOM03_TAGS
+                        elif self.result["version"] == "atom10":
+                            atom_tags = _ATOM_TAGS
+                        if atom_tags is not None:
+                            entry_tag = atom_tags["entry"]
+                            streamed = {entry_tag: []}
+                    elif atom_tags is None and elem.tag in streamed:
+                        items = streamed[elem.tag]
+                        open_items.append((items, len(items)))
+                        items.append(None)
+                    depth += 1
+                    continue
+
+                depth -= 1
+                tag = elem.tag
+                if atom_tags is not None:
+                    # Atom entries are direct children of <feed>
+                    if depth == 1 and tag == entry_tag:
+                        streamed[tag].append(self._parse_atom_entry(elem, atom_tags))
+                        elem.clear()
+                elif depth and tag in streamed:
+                    items, slot = open_items.pop()
+                    items[slot] = self._parse_rss_item(elem)
+                    # Nested items are released with their outermost item,
+                    # which still needs the text around them
+                    if not open_items:
+                        elem.clear()
+        except ET.ParseError as e:
+            if root is None:
+                raise
+            self._set_bozo(e)
+
+        if open_items:
+            # Items cut off by a parse error never got filled in
+            streamed = {tag: [item for item in items if item is not None]
+                        for tag, items in streamed.items()}
+
+        if _HAVE_LXML and not self.result["bozo"]:
+            self._record_recovered_errors(events.error_log)
+
+        if root is None:
+            return
+
+        if atom_tags is not None:
+            self._parse_atom(root, streamed, atom_tags)
+        else:
+            self._parse_rss(root, streamed)
+
+    def _record_recovered_errors(self, error_log):
+        """
+        Flag the result as bozo if lxml had to recover from syntax errors.
+        """
+        errors = error_log.filter_from_errors()
+        if errors:
+            error = errors[0]
+            self._set_bozo(ET.XMLSyntaxError(error.message, error.type, error.line, error.column))
 
     def _extract_namespaces(self, root):
         """
         Extract namespace mappings from document.
         """
-        # ElementTree doesn't expose namespace declarations directly
-        # We'll use the registered namespaces
-        for prefix, uri in NAMESPACES.items():
-            self.result.namespaces[prefix] = uri
+        # ElementTree doesn't expose namespace declarations directly, so
+        # every feed reports the registered namespaces, copied in one step
+        # so results stay picklable and independently mutable
+        self.result["namespaces"] = dict(NAMESPACES)
 
-    def _parse_rss(self, root):
+    def _parse_rss(self, root, streamed):
         """
         Parse RSS 0.9x, 1.0, or 2.0 feed.
+
+        Items have already been parsed while streaming; ``streamed`` maps
+        item tags to the resulting entries.
         """
         # Find channel element
         channel = root.find("channel")
         if channel is None:
             # RSS 1.0 uses namespaced channel
-            channel = root.find("{http://purl.org/rss/1.0/}channel")
+            channel = root.find(_RSS10_CHANNEL)
         if channel is None:
             channel = root
 
         # Parse feed metadata
         self._parse_rss_channel(channel)
 
-        # Parse items
-        items = root.findall(".//item")
-        if not items:
-            items = root.findall(".//{http://purl.org/rss/1.0/}item")
-
-        for item in items:
-            entry = self._parse_rss_item(item)
-            self.result.entries.append(entry)
+        # Items
+        entries = streamed["item"] or streamed[_RSS10_ITEM]
+        self.result["entries"].extend(entries)
 
     def _parse_rss_channel(self, channel):
         """
         Parse RSS channel metadata into feed dict.
         """
-        feed = self.result.feed
+        feed = self.result["feed"]
 
         # Title
         title = self._get_text(channel, "title")
         if title:
-            feed.title = title
-            feed.title_detail = make_detail(title)
+            feed["title"] = title
+            feed["title_detail"] = make_detail(title)
 
         # Link
         link = self._get_text(channel, "link")
         if link:
-            feed.link = link
-            feed.links = [make_link(link)]
+            feed["link"] = link
+            feed["links"] = [make_link(link)]
 
         # Description/subtitle
         desc = self._get_text(channel, "description")
         if desc:
-            feed.subtitle = desc
-            feed.subtitle_detail = make_detail(desc, detect_content_type(desc))
+            feed["subtitle"] = desc
+            feed["subtitle_detail"] = make_detail(desc, detect_content_type(desc))
 
         # Language
         lang = self._get_text(channel, "language")
         if lang:
-            feed.language = lang
+            feed["language"] = lang
 
         # Published/updated dates
         pub_date = self._get_text(channel, "pubDate") or self._get_text(channel, "lastBuildDate")
         if pub_date:
-            feed.updated = pub_date
-            feed.updated_parsed = _parse_date(pub_date)
+            feed["updated"] = pub_date
+            feed["updated_parsed"] = _parse_date(pub_date)
 
         # Image
         image = channel.find("image")
         if image is not None:
-            feed.image = FeedParserDict()
-            feed.image.url = self._get_text(image, "url")
-            feed.image.title = self._get_text(image, "title")
-            feed.image.link = self._get_text(image, "link")
+            feed["image"] = FeedParserDict()
+            feed["image"]["url"] = self._get_text(image, "url")
+            feed["image"]["title"] = self._get_text(image, "title")
+            feed["image"]["link"] = self._get_text(image, "link")
 
         # Generator
         generator = self._get_text(channel, "generator")
         if generator:
-            feed.generator = generator
-            feed.generator_detail = FeedParserDict({"name": generator})
+            feed["generator"] = generator
+            feed["generator_detail"] = FeedParserDict({"name": generator})
 
         # Copyright/rights
         copyright_ = self._get_text(channel, "copyright")
         if copyright_:
-            feed.rights = copyright_
-            feed.rights_detail = make_detail(copyright_)
+            feed["rights"] = copyright_
+            feed["rights_detail"] = make_detail(copyright_)
 
         # Managing editor as author
         editor = self._get_text(channel, "managingEditor")
         if editor:
-            feed.author = editor
-            feed.author_detail = make_person(name=editor)
+            feed["author"] = editor
+            feed["author_detail"] = make_person(name=editor)
 
         # Categories/tags
         categories = channel.findall("category")
         if categories:
-            feed.tags = []
-            for cat in categories:
-                term = cat.text or ""
-                domain = cat.get("domain")
-                feed.tags.append(make_tag(term, scheme=domain))
+            feed["tags"] = [make_tag(cat.text or "", scheme=cat.get("domain")) for cat in categories]
 
     def _parse_rss_item(self, item):
         """
         Parse RSS item into entry dict.
         """
         entry = FeedParserDict()
+        children = _index_children(item)
 
         # Title
-        title = self._get_text(item, "title")
+        title = _child_text(children, "title")
         if title:
-            entry.title = title
-            entry.title_detail = make_detail(title)
+            entry["title"] = title
+            entry["title_detail"] = make_detail(title)
 
         # Link
-        link = self._get_text(item, "link")
+        link = _child_text(children, "link")
         if link:
-            entry.link = link
-            entry.links = [make_link(link)]
+            entry["link"] = link
+            entry["links"] = [make_link(link)]
 
         # Description/summary
-        desc = self._get_text(item, "description")
+        desc = _child_text(children, "description")
         if desc:
-            entry.summary = desc
-            entry.summary_detail = make_detail(desc, detect_content_type(desc))
+            entry["summary"] = desc
+            entry["summary_detail"] = make_detail(desc, detect_content_type(desc))
 
         # Content (content:encoded)
-        content = self._get_text(item, "{http://purl.org/rss/1.0/modules/content/}encoded")
+        content = _child_text(children, _CONTENT_ENCODED)
         if content:
-            entry.content = [make_content(content)]
+            entry["content"] = [make_content(content)]
 
         # GUID/id
-        guid = self._get_text(item, "guid")
+        guid = _child_text(children, "guid")
         if guid:
-            entry.id = guid
+            entry["id"] = guid
         elif link:
-            entry.id = link
+            entry["id"] = link
 
         # Published date
-        pub_date = self._get_text(item, "pubDate")
+        pub_date = _child_text(children, "pubDate")
         if pub_date:
-            entry.published = pub_date
-            entry.published_parsed = _parse_date(pub_date)
-            entry.updated = pub_date
-            entry.updated_parsed = _parse_date(pub_date)
+            pub_parsed = _parse_date(pub_date)
+            entry["published"] = pub_date
+            entry["published_parsed"] = pub_parsed
+            entry["updated"] = pub_date
+            entry["updated_parsed"] = pub_parsed
 
         # Author
-        author = self._get_text(item, "author")
+        author = _child_text(children, "author")
         if not author:
-            author = self._get_text(item, "{http://purl.org/dc/elements/1.1/}creator")
+            author = _child_text(children, _DC_CREATOR)
         if author:
-            entry.author = author
-            entry.author_detail = make_person(name=author)
+            entry["author"] = author
+            entry["author_detail"] = make_person(name=author)
 
         # Categories/tags
-        categories = item.findall("category")
+        categories = children.get("category")
         if categories:
-            entry.tags = []
-            for cat in categories:
-                term = cat.text or ""
-                domain = cat.get("domain")
-                entry.tags.append(make_tag(term, scheme=domain))
+            entry["tags"] = [make_tag(cat.text or "", scheme=cat.get("domain")) for cat in categories]
 
         # Enclosures
-        enclosure = item.find("enclosure")
+        enclosure = _first_child(children, "enclosure")
         if enclosure is not None:
             enc = make_enclosure(
                 enclosure.get("url", ""),
                 enclosure.get("type"),
                 enclosure.get("length")
             )
-            entry.enclosures = [enc]
+            entry["enclosures"] = [enc]
 
         # Comments
-        comments = self._get_text(item, "comments")
+        comments = _child_text(children, "comments")
         if comments:
-            entry.comments = comments
+            entry["comments"] = comments
 
         return entry
 
-    def _parse_atom(self, root):
+    def _parse_atom(self, root, streamed, tags):
         """
         Parse Atom 0.3 or 1.0 feed.
+
+        Entries have already been parsed while streaming; ``streamed`` maps
+        entry tags to the resulting entries. ``tags`` maps Atom element
+        names to their tags in the feed's namespace.
         """
         # Parse feed metadata
-        self._parse_atom_feed(root)
-
-        # Parse entries
-        entries = root.findall("{http://www.w3.org/2005/Atom}entry")
-        if not entries:
-            entries = root.findall("{http://purl.org/atom/ns#}entry")
-        if not entries:
-            entries = root.findall("entry")
+        self._parse_atom_feed(root, tags)
 
-        for entry_elem in entries:
-            entry = self._parse_atom_entry(entry_elem)
-            self.result.entries.append(entry)
+        # Entries
+        self.result["entries"].extend(streamed[tags["entry"]])
 
-    def _parse_atom_feed(self, root):
+    def _parse_atom_feed(self, root, tags):
         """
         Parse Atom feed metadata.
         """
-        feed = self.result.feed
-        ns = "{http://www.w3.org/2005/Atom}"
+        feed = self.result["feed"]
+        children = _index_children(root)
 
-        # Try both namespaced and non-namespaced
         def find_text(tag):
-            elem = root.find(f"{ns}{tag}")
-            if elem is None:
-                elem = root.find(tag)
-            if elem is not None and elem.text:
-                return elem.text.strip()
-            return None
+            return _child_text(children, tags[tag])
 
         def find_elem(tag):
-            elem = root.find(f"{ns}{tag}")
-            if elem is None:
-                elem = root.find(tag)
-            return elem
+            return _first_child(children, tags[tag])
 
         # Title
-        title = find_text("title")
+        title_elem = find_elem("title")
+        title = _element_text(title_elem)
         if title:
-            feed.title = title
-            title_elem = find_elem("title")
-            type_ = title_elem.get("type", "text") if title_elem is not None else "text"
-            feed.title_detail = make_detail(title, f"text/{type_}" if "/" not in type_ else type_)
+            feed["title"] = title
+            type_ = title_elem.get("type", "text")
+            feed["title_detail"] = make_detail(title, _atom_type(type_))
 
         # Links
-        links = root.findall(f"{ns}link") or root.findall("link")
-        feed.links = []
+        links = _all_children(children, tags["link"])
+        feed["links"] = []
         for link in links:
-            rel = link.get("rel", "alternate")
+            rel = link.get("rel", _ALTERNATE)
             href = link.get("href", "")
             type_ = link.get("type")
             title = link.get("title")
-            feed.links.append(make_link(href, rel, type_, title))
-            if rel == "alternate" and href:
-                feed.link = href
+            feed["links"].append(make_link(href, rel, type_, title))
+            if rel == _ALTERNATE and href:
+                feed["link"] = href
 
         # Subtitle
         subtitle = find_text("subtitle") or find_text("tagline")
         if subtitle:
-            feed.subtitle = subtitle
-            feed.subtitle_detail = make_detail(subtitle)
+            feed["subtitle"] = subtitle
+            feed["subtitle_detail"] = make_detail(subtitle)
 
         # ID
         id_ = find_text("id")
         if id_:
-            feed.id = id_
+            feed["id"] = id_
 
         # Updated
         updated = find_text("updated") or find_text("modified")
         if updated:
-            feed.updated = updated
-            feed.updated_parsed = _parse_date(updated)
+            feed["updated"] = updated
+            feed["updated_parsed"] = _parse_date(updated)
 
         # Author
         author_elem = find_elem("author")
         if author_elem is not None:
-            name = self._get_text(author_elem, f"{ns}name") or self._get_text(author_elem, "name")
-            email = self._get_text(author_elem, f"{ns}email") or self._get_text(author_elem, "email")
-            uri = self._get_text(author_elem, f"{ns}uri") or self._get_text(author_elem, "uri")
-            feed.author = name or email or ""
-            feed.author_detail = make_person(name, email, uri)
+            person = self._parse_person(author_elem, tags)
+            feed["author"] = person.get("name") or person.get("email") or ""
+            feed["author_detail"] = person
 
         # Generator
         generator_elem = find_elem("generator")
         if generator_elem is not None and generator_elem.text:
-            feed.generator = generator_elem.text.strip()
-            feed.generator_detail = FeedParserDict({
-                "name": generator_elem.text.strip(),
+            generator = generator_elem.text.strip()
+            feed["generator"] = generator
+            feed["generator_detail"] = FeedParserDict({
+                "name": generator,
                 "href": generator_elem.get("uri"),
                 "version": generator_elem.get("version"),
             })
@@ -457,129 +659,106 @@ class FeedParser:
         # Rights
         rights = find_text("rights")
         if rights:
-            feed.rights = rights
-            feed.rights_detail = make_detail(rights)
+            feed["rights"] = rights
+            feed["rights_detail"] = make_detail(rights)
 
         # Categories
-        categories = root.findall(f"{ns}category") or root.findall("category")
+        categories = _all_children(children, tags["category"])
         if categories:
-            feed.tags = []
-            for cat in categories:
-                term = cat.get("term", "")
-                scheme = cat.get("scheme")
-                label = cat.get("label")
-                feed.tags.append(make_tag(term, scheme, label))
+            feed["tags"] = [
+                make_tag(cat.get("term", ""), cat.get("scheme"), cat.get("label"))
+                for cat in categories
+            ]
 
-    def _parse_atom_entry(self, entry_elem):
+    def _parse_atom_entry(self, entry_elem, tags):
         """
         Parse Atom entry into entry dict.
         """
         entry = FeedParserDict()
-        ns = "{http://www.w3.org/2005/Atom}"
-
-        def find_text(tag):
-            elem = entry_elem.find(f"{ns}{tag}")
-            if elem is None:
-                elem = entry_elem.find(tag)
-            if elem is not None and elem.text:
-                return elem.text.strip()
-            return None
-
-        def find_elem(tag):
-            elem = entry_elem.find(f"{ns}{tag}")
-            if elem is None:
-                elem = entry_elem.find(tag)
-            return elem
+        children = _index_children(entry_elem)
 
         # Title
-        title = find_text("title")
+        title_elem = _first_child(children, tags["title"])
+        title = _element_text(title_elem)
         if title:
-            entry.title = title
-            title_elem = find_elem("title")
-            type_ = title_elem.get("type", "text") if title_elem is not None else "text"
-            entry.title_detail = make_detail(title, f"text/{type_}" if "/" not in type_ else type_)
+            entry["title"] = title
+            type_ = title_elem.get("type", "text")
+            entry["title_detail"] = make_detail(title, _atom_type(type_))
 
         # Links
-        links = entry_elem.findall(f"{ns}link") or entry_elem.findall("link")
-        entry.links = []
-        entry.enclosures = []
+        links = _all_children(children, tags["link"])
+        entry["links"] = []
+        entry["enclosures"] = []
         for link in links:
-            rel = link.get("rel", "alternate")
+            rel = link.get("rel", _ALTERNATE)
             href = link.get("href", "")
             type_ = link.get("type")
             title = link.get("title")
             length = link.get("length")
 
-            if rel == "enclosure":
-                entry.enclosures.append(make_enclosure(href, type_, length))
+            if rel == _ENCLOSURE:
+                entry["enclosures"].append(make_enclosure(href, type_, length))
             else:
-                entry.links.append(make_link(href, rel, type_, title))
-                if rel == "alternate" and href:
-                    entry.link = href
+                entry["links"].append(make_link(href, rel, type_, title))
+                if rel == _ALTERNATE and href:
+                    entry["link"] = href
 
         # Summary
-        summary = find_text("summary")
+        summary_elem = _first_child(children, tags["summary"])
+        summary = _element_text(summary_elem)
         if summary:
-            entry.summary = summary
-            summary_elem = find_elem("summary")
-            type_ = summary_elem.get("type", "text") if summary_elem is not None else "text"
-            entry.summary_detail = make_detail(summary, f"text/{type_}" if "/" not in type_ else type_)
+            entry["summary"] = summary
+            type_ = summary_elem.get("type", "text")
+            entry["summary_detail"] = make_detail(summary, _atom_type(type_))
 
         # Content
-        content_elem = find_elem("content")
+        content_elem = _first_child(children, tags["content"])
         if content_elem is not None:
             content_text = content_elem.text or ""
             type_ = content_elem.get("type", "text")
-            entry.content = [make_content(content_text, f"text/{type_}" if "/" not in type_ else type_)]
+            entry["content"] = [make_content(content_text, _atom_type(type_))]
 
         # ID
-        id_ = find_text("id")
+        id_ = _child_text(children, tags["id"])
         if id_:
-            entry.id = id_
+            entry["id"] = id_
 
         # Published
-        published = find_text("published") or find_text("issued")
+        published = (_child_text(children, tags["published"])
+                     or _child_text(children, tags["issued"]))
         if published:
-            entry.published = published
-            entry.published_parsed = _parse_date(published)
+            entry["published"] = published
+            entry["published_parsed"] = _parse_date(published)
 
         # Updated
-        updated = find_text("updated") or find_text("modified")
+        updated = (_child_text(children, tags["updated"])
+                   or _child_text(children, tags["modified"]))
         if updated:
-            entry.updated = updated
-            entry.updated_parsed = _parse_date(updated)
+            entry["updated"] = updated
+            entry["updated_parsed"] = _parse_date(updated)
         elif published:
-            entry.updated = published
-            entry.updated_parsed = _parse_date(published)
+            entry["updated"] = published
+            entry["updated_parsed"] = entry["published_parsed"]
 
         # Author
-        author_elem = find_elem("author")
+        author_elem = _first_child(children, tags["author"])
         if author_elem is not None:
-            name = self._get_text(author_elem, f"{ns}name") or self._get_text(author_elem, "name")
-            email = self._get_text(author_elem, f"{ns}email") or self._get_text(author_elem, "email")
-            uri = self._get_text(author_elem, f"{ns}uri") or self._get_text(author_elem, "uri")
-            entry.author = name or email or ""
-            entry.author_detail = make_person(name, email, uri)
+            person = self._parse_person(author_elem, tags)
+            entry["author"] = person.get("name") or person.get("email") or ""
+            entry["author_detail"] = person
 
         # Contributors
-        contributors = entry_elem.findall(f"{ns}contributor") or entry_elem.findall("contributor")
+        contributors = _all_children(children, tags["contributor"])
         if contributors:
-            entry.contributors = []
-            for contrib in contributors:
-                name = self._get_text(contrib, f"{ns}name") or self._get_text(contrib, "name")
-                email = self._get_text(contrib, f"{ns}email") or self._get_text(contrib, "email")
-                uri = self._get_text(contrib, f"{ns}uri") or self._get_text(contrib, "uri")
-                entry.contributors.append(make_person(name, email, uri))
+            entry["contributors"] = [self._parse_person(contrib, tags) for contrib in contributors]
 
         # Categories
-        categories = entry_elem.findall(f"{ns}category") or entry_elem.findall("category")
+        categories = _all_children(children, tags["category"])
         if categories:
-            entry.tags = []
-            for cat in categories:
-                term = cat.get("term", "")
-                scheme = cat.get("scheme")
-                label = cat.get("label")
-                entry.tags.append(make_tag(term, scheme, label))
+            entry["tags"] = [
+                make_tag(cat.get("term", ""), cat.get("scheme"), cat.get("label"))
+                for cat in categories
+            ]
 
         return entry
 
@@ -588,9 +767,20 @@ class FeedParser:
         Get text content of a child element.
         """
         child = elem.find(tag)
-        if child is not None and child.text:
-            return child.text.strip()
-        return None
+        if child is None:
+            return None
+        text = child.text
+        return text.strip() if text else None
+
+    def _parse_person(self, elem, tags):
+        """
+        Parse an Atom author/contributor element into a person dict.
+        """
+        children = _index_children(elem)
+        name = _child_text(children, tags["name"])
+        email = _child_text(children, tags["email"])
+        uri = _child_text(children, tags["uri"])
+        return make_person(name, email, uri)
 
 
 def parse(url_file_stream_or_string, etag=None, modified=None,
@@ -31,9 +31,39 @@ SAFE_ATTRS = frozenset([
     "valign", "value", "vspace", "width", "xml:lang"
 ])
 
+# Translation table matching html.escape(value, quote=True)
+_ATTR_ESCAPE = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;",
+})
+
 # Pattern for stripping tags
 STRIP_TAGS_RE = re.compile(r"<[^>]+>")
 
+# Common HTML indicators ("<p", "<br", "<div", "<span", "<a ", "<img",
+# "&amp;", "&lt;", "&gt;") folded into one prefix-grouped alternation
+HTML_INDICATORS_RE = re.compile(r"<(?:p|br|div|span|a |img)|&(?:amp|lt|gt);", re.IGNORECASE)
+
+# Tokenizer for well-formed markup: start tag, end tag, text run or a
+# lone "<" (anything HTMLSanitizer would have to handle specially)
+_TOKEN_RE = re.compile(
+    r"<(?:([a-zA-Z][a-zA-Z0-9]*)"
+    r"((?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*"
+    r"(?:\s*=\s*(?:\"[^\"<>]*\"|'[^'<>]*'|[^\s\"'=<>`/]+(?=[\s>])))?)*)\s*(/?)>"
+    r"|/([a-zA-Z][a-zA-Z0-9]*)\s*>)"
+    r"|([^<]+)"
+    r"|<"
+)
+_ATTR_RE = re.compile(
+    r"([a-zA-Z_:][-a-zA-Z0-9_:.]*)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s\"'=<>`/]+))?"
+)
+_PARTIAL_CHARREF_RE = re.compile(r"[\s;]")
+
+# Elements whose content HTMLParser reads as raw text
+_RAW_TEXT_TAGS = frozenset([
+    "iframe", "noembed", "noframes", "noscript", "plaintext", "script",
+    "style", "textarea", "title", "xmp",
+])
+
 
 class HTMLSanitizer(HTMLParser):
     """
@@ -49,13 +79,14 @@ class HTMLSanitizer(HTMLParser):
         tag = tag.lower()
         if tag in SAFE_TAGS:
             safe_attrs = []
+            # HTMLParser already lowercases attribute names
             for name, value in attrs:
-                if name.lower() in SAFE_ATTRS:
+                if name in SAFE_ATTRS:
                     if value is None:
                         safe_attrs.append(name)
                     else:
                         # Escape attribute value
-                        value = html.escape(value, quote=True)
+                        value = value.translate(_ATTR_ESCAPE)
                         safe_attrs.append(f'{name}="{value}"')
             attr_str = " ".join(safe_attrs)
             if attr_str:
@@ -88,6 +119,72 @@ class HTMLSanitizer(HTMLParser):
         return "".join(self.result)
 
 
+def _sanitize_tokens(html_content):
+    """
+    Sanitize well-formed HTML in a single regex tokenizing pass.
+
+    Produces the same output as HTMLSanitizer for markup made only of
+    plain start/end tags, text and entities.
+
+    Args:
+        html_content: HTML string to sanitize
+
+    Returns:
+        Sanitized HTML string, or None if the content needs HTMLSanitizer
+    """
+    result = []
+    append = result.append
+    in_unsafe = 0
+    escape = html.escape
+    unescape = html.unescape
+
+    for match in _TOKEN_RE.finditer(html_content):
+        tag, attrs, closed, end_tag, text = match.groups()
+        if text is not None:
+            if match.end() == len(html_content):
+                # HTMLParser holds back trailing text that may end in a
+                # partial character reference
+                amppos = text.rfind("&", max(0, len(text) - 34))
+                if amppos >= 0 and not _PARTIAL_CHARREF_RE.search(text, amppos):
+                    break
+            if in_unsafe == 0:
+                append(escape(unescape(text)))
+        elif tag is not None:
+            tag = tag.lower()
+            if tag in _RAW_TEXT_TAGS:
+                return None
+            if tag in SAFE_TAGS:
+                safe_attrs = []
+                for name, value in _ATTR_RE.findall(attrs):
+                    name = name.lower()
+                    if name in SAFE_ATTRS:
+                        if not value:
+                            safe_attrs.append(name)
+                        else:
+                            if value[0] in "\"'":
+                                value = value[1:-1]
+                            value = unescape(value).translate(_ATTR_ESCAPE)
+                            safe_attrs.append(f'{name}="{value}"')
+                if safe_attrs:
+                    append(f"<{tag} {' '.join(safe_attrs)}>")
+                else:
+                    append(f"<{tag}>")
+                if closed:
+                    append(f"</{tag}>")
+            elif not closed:
+                in_unsafe += 1
+        elif end_tag is not None:
+            end_tag = end_tag.lower()
+            if end_tag in SAFE_TAGS:
+                append(f"</{end_tag}>")
+            elif in_unsafe > 0:
+                in_unsafe -= 1
+        else:
+            return None
+
+    return "".join(result)
+
+
 def sanitize_html(html_content):
     """
     Sanitize HTML content, removing unsafe tags and attributes.
@@ -102,6 +199,9 @@ def sanitize_html(html_content):
         return ""
 
     try:
+        result = _sanitize_tokens(html_content)
+        if result is not None:
+            return result
         sanitizer = HTMLSanitizer()
         sanitizer.feed(html_content)
         return sanitizer.get_result()
@@ -124,9 +224,10 @@ def strip_tags(html_content):
         return ""
 
     # Unescape HTML entities first
-    text = html.unescape(html_content)
-    # Remove all tags
-    text = STRIP_TAGS_RE.sub("", text)
+    text = html.unescape(html_content) if "&" in html_content else html_content
+    # Remove all tags (including any that were entity-escaped)
+    if "<" in text:
+        text = STRIP_TAGS_RE.sub("", text)
     # Normalize whitespace
     text = " ".join(text.split())
     return text
@@ -146,11 +247,7 @@ def detect_content_type(content):
         return "text/plain"
 
     # Check for common HTML indicators
-    html_indicators = ["<p", "<br", "<div", "<span", "<a ", "<img", "&amp;", "&lt;", "&gt;"]
-    content_lower = content.lower()
-
-    for indicator in html_indicators:
-        if indicator in content_lower:
-            return "text/html"
+    if HTML_INDICATORS_RE.search(content):
+        return "text/html"
 
     return "text/plain"
@@ -4,6 +4,10 @@ Wraps Python's hashlib for educational facade.
 """
 
 import hashlib as _hashlib
+import io
+import mmap
+import os
+import stat
 
 # Export available and guaranteed algorithms
 algorithms_available = frozenset(_hashlib.algorithms_available)
@@ -217,14 +221,21 @@ def blake2s(data=b"", *, digest_size=32, **kwargs):
     return Hash("blake2s", data, digest_size=digest_size, **kwargs)
 
 
-def file_digest(fileobj, digest, *, _bufsize=2**18):
+def file_digest(fileobj, digest, *, _bufsize=2**20):
     """
     Hash the contents of a file-like object.
 
+    Regular on-disk files (io.FileIO, or a buffered reader over one) are
+    hashed straight from a read-only memory map; all other binary streams,
+    including compressed and archive wrappers, are read in _bufsize
+    chunks. Truncating a file while it is being hashed through the map
+    raises SIGBUS rather than an exception, so do not use this on files
+    that may shrink concurrently (e.g. logs under rotation).
+
     Args:
         fileobj: File-like object opened in binary mode
         digest: Hash algorithm name or constructor
-        _bufsize: Buffer size for reading (default 256KB)
+        _bufsize: Buffer size for reading (default 1MB)
 
     Returns:
         Hash: Hash object with file contents hashed
@@ -234,6 +245,27 @@ def file_digest(fileobj, digest, *, _bufsize=2**18):
     else:
         hash_obj = new(digest)
 
+    mapped = None
+    if isinstance(getattr(fileobj, "raw", fileobj), io.FileIO):
+        try:
+            fd = fileobj.fileno()
+            if stat.S_ISREG(os.fstat(fd).st_mode):
+                position = fileobj.tell()
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # Empty files and descriptors that cannot be mapped
+            mapped = None
+
+    if mapped is not None:
+        with mapped:
+            size = len(mapped)
+            with memoryview(mapped) as view:
+                hash_obj.update(view[position:])
+        # Leave the stream at EOF, as the read loop would
+        if position < size:
+            fileobj.seek(size)
+        return hash_obj
+
     buf = bytearray(_bufsize)
     view = memoryview(buf)
     while True:
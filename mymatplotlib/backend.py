@@ -4,10 +4,16 @@ mymatplotlib backend
 Renders figures to various formats (SVG, text summary).
 """
 
+import io
 import os
+import re
 from typing import Optional
 from .colors import to_hex, LINE_STYLES
 
+# Single-pass translation table and pre-check for XML special characters
+_XML_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+_XML_UNSAFE_RE = re.compile(r'[&<>"]')
+
 
 def save_figure(fig, fname: str, dpi: int = 100, format: str = None):
     """Save figure to file"""
@@ -37,35 +43,36 @@ def render_svg(fig, dpi: int = 100) -> str:
     width_px = int(fig.figsize[0] * dpi)
     height_px = int(fig.figsize[1] * dpi)
 
-    lines = [
-        f'<?xml version="1.0" encoding="UTF-8"?>',
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width_px}" height="{height_px}" viewBox="0 0 {width_px} {height_px}">',
-        f'  <rect width="100%" height="100%" fill="{fig.facecolor}"/>',
-    ]
+    out = io.StringIO()
+    write = out.write
+    write(f'<?xml version="1.0" encoding="UTF-8"?>\n'
+          f'<svg xmlns="http://www.w3.org/2000/svg" width="{width_px}" height="{height_px}" viewBox="0 0 {width_px} {height_px}">\n'
+          f'  <rect width="100%" height="100%" fill="{fig.facecolor}"/>\n')
 
     # Render each axes
     for ax in fig.axes:
-        lines.extend(_render_axes_svg(ax, fig, dpi))
+        _render_axes_svg(ax, fig, dpi, write)
 
     # Suptitle
     if fig._suptitle:
         x = width_px / 2
         y = 20
-        lines.append(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="14" font-weight="bold">{_escape_xml(fig._suptitle)}</text>')
+        write(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="14" font-weight="bold">{_escape_xml(fig._suptitle)}</text>\n')
 
-    lines.append('</svg>')
+    write('</svg>')
 
-    return '\n'.join(lines)
+    return out.getvalue()
 
 
 def _escape_xml(s: str) -> str:
     """Escape XML special characters"""
-    return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+    if not _XML_UNSAFE_RE.search(s):
+        return s
+    return s.translate(_XML_TABLE)
 
 
-def _render_axes_svg(ax, fig, dpi: int) -> list:
-    """Render a single axes to SVG elements"""
-    lines = []
+def _render_axes_svg(ax, fig, dpi: int, write) -> None:
+    """Render a single axes, writing its SVG elements through write"""
 
     width_px = int(fig.figsize[0] * dpi)
     height_px = int(fig.figsize[1] * dpi)
@@ -80,47 +87,69 @@ def _render_axes_svg(ax, fig, dpi: int) -> list:
     # Get data limits
     xlim = ax.get_xlim()
     ylim = ax.get_ylim()
+    x0, x_span = xlim[0], xlim[1] - xlim[0]
+    y0, y_span = ylim[0], ylim[1] - ylim[0]
+    y_base = ax_bottom + ax_height
 
     def data_to_svg(x, y):
         """Convert data coordinates to SVG coordinates"""
-        sx = ax_left + (x - xlim[0]) / (xlim[1] - xlim[0]) * ax_width
-        sy = ax_bottom + ax_height - (y - ylim[0]) / (ylim[1] - ylim[0]) * ax_height
+        sx = ax_left + (x - x0) / x_span * ax_width
+        sy = y_base - (y - y0) / y_span * ax_height
         return sx, sy
 
+    def data_to_svg_all(xdata, ydata):
+        """Convert whole coordinate sequences to SVG coordinate pairs"""
+        sxs = [ax_left + (x - x0) / x_span * ax_width for x in xdata]
+        sys_ = [y_base - (y - y0) / y_span * ax_height for y in ydata]
+        return list(zip(sxs, sys_))
+
+    hex_cache = {}
+
+    def hex_color(color):
+        """Convert color to hex, reusing results for colors seen before"""
+        try:
+            return hex_cache[color]
+        except KeyError:
+            result = hex_cache[color] = to_hex(color)
+            return result
+        except TypeError:
+            # Unhashable colors (lists) are converted directly
+            return to_hex(color)
+
     # Create clip path
     clip_id = f"clip_{id(ax)}"
-    lines.append(f'  <defs>')
-    lines.append(f'    <clipPath id="{clip_id}">')
-    lines.append(f'      <rect x="{ax_left}" y="{ax_bottom}" width="{ax_width}" height="{ax_height}"/>')
-    lines.append(f'    </clipPath>')
-    lines.append(f'  </defs>')
+    write(f'  <defs>\n')
+    write(f'    <clipPath id="{clip_id}">\n')
+    write(f'      <rect x="{ax_left}" y="{ax_bottom}" width="{ax_width}" height="{ax_height}"/>\n')
+    write(f'    </clipPath>\n')
+    write(f'  </defs>\n')
 
     # Axes background
-    lines.append(f'  <rect x="{ax_left}" y="{ax_bottom}" width="{ax_width}" height="{ax_height}" fill="white" stroke="black" stroke-width="1"/>')
+    write(f'  <rect x="{ax_left}" y="{ax_bottom}" width="{ax_width}" height="{ax_height}" fill="white" stroke="black" stroke-width="1"/>\n')
 
     # Grid
     if ax._grid_on:
         grid_color = ax._grid_kwargs.get('color', '#cccccc')
-        lines.append(f'  <g stroke="{grid_color}" stroke-width="0.5" stroke-dasharray="2,2">')
+        write(f'  <g stroke="{grid_color}" stroke-width="0.5" stroke-dasharray="2,2">\n')
 
         # X grid lines
         xticks = ax._xticks or _auto_ticks(xlim[0], xlim[1])
         for tick in xticks:
             sx, _ = data_to_svg(tick, 0)
             if ax_left <= sx <= ax_left + ax_width:
-                lines.append(f'    <line x1="{sx}" y1="{ax_bottom}" x2="{sx}" y2="{ax_bottom + ax_height}"/>')
+                write(f'    <line x1="{sx}" y1="{ax_bottom}" x2="{sx}" y2="{ax_bottom + ax_height}"/>\n')
 
         # Y grid lines
         yticks = ax._yticks or _auto_ticks(ylim[0], ylim[1])
         for tick in yticks:
             _, sy = data_to_svg(0, tick)
             if ax_bottom <= sy <= ax_bottom + ax_height:
-                lines.append(f'    <line x1="{ax_left}" y1="{sy}" x2="{ax_left + ax_width}" y2="{sy}"/>')
+                write(f'    <line x1="{ax_left}" y1="{sy}" x2="{ax_left + ax_width}" y2="{sy}"/>\n')
 
-        lines.append('  </g>')
+        write('  </g>\n')
 
     # Render patches (bars, etc.)
-    lines.append(f'  <g clip-path="url(#{clip_id})">')
+    write(f'  <g clip-path="url(#{clip_id})">\n')
     for patch in ax.patches:
         if hasattr(patch, 'xy'):  # Rectangle
             x, y = patch.xy
@@ -128,20 +157,20 @@ def _render_axes_svg(ax, fig, dpi: int) -> list:
             sw = patch.width / (xlim[1] - xlim[0]) * ax_width
             sh = patch.height / (ylim[1] - ylim[0]) * ax_height
 
-            fill = to_hex(patch.facecolor)
-            stroke = to_hex(patch.edgecolor) if patch.edgecolor != 'none' else 'none'
+            fill = hex_color(patch.facecolor)
+            stroke = hex_color(patch.edgecolor) if patch.edgecolor != 'none' else 'none'
             alpha = patch.alpha
 
-            lines.append(f'    <rect x="{sx}" y="{sy}" width="{sw}" height="{sh}" fill="{fill}" stroke="{stroke}" opacity="{alpha}"/>')
-    lines.append('  </g>')
+            write(f'    <rect x="{sx}" y="{sy}" width="{sw}" height="{sh}" fill="{fill}" stroke="{stroke}" opacity="{alpha}"/>\n')
+    write('  </g>\n')
 
     # Render lines
-    lines.append(f'  <g clip-path="url(#{clip_id})">')
+    write(f'  <g clip-path="url(#{clip_id})">\n')
     for line in ax.lines:
         if not line.visible or not line.xdata:
             continue
 
-        color = to_hex(line.color)
+        color = hex_color(line.color)
         stroke_width = line.linewidth
         linestyle = line.linestyle
 
@@ -154,63 +183,61 @@ def _render_axes_svg(ax, fig, dpi: int) -> list:
         elif linestyle in ('-.', 'dashdot'):
             dash = 'stroke-dasharray="5,2,2,2"'
 
-        # Draw line
-        if linestyle and linestyle not in ('', ' ', 'none'):
-            points = []
-            for x, y in zip(line.xdata, line.ydata):
-                sx, sy = data_to_svg(x, y)
-                points.append(f'{sx},{sy}')
+        draw_line = linestyle and linestyle not in ('', ' ', 'none')
+        draw_markers = line.marker and line.marker not in ('', ' ', 'none')
+        if draw_line or draw_markers:
+            coords = data_to_svg_all(line.xdata, line.ydata)
 
-            if points:
-                lines.append(f'    <polyline points="{" ".join(points)}" fill="none" stroke="{color}" stroke-width="{stroke_width}" {dash}/>')
+        # Draw line
+        if draw_line and coords:
+            points = " ".join([f'{sx},{sy}' for sx, sy in coords])
+            write(f'    <polyline points="{points}" fill="none" stroke="{color}" stroke-width="{stroke_width}" {dash}/>\n')
 
         # Draw markers
-        if line.marker and line.marker not in ('', ' ', 'none'):
+        if draw_markers:
             marker_size = line.markersize
-            mfc = to_hex(line.markerfacecolor)
-            mec = to_hex(line.markeredgecolor)
-
-            for x, y in zip(line.xdata, line.ydata):
-                sx, sy = data_to_svg(x, y)
-
-                if line.marker == 'o':
-                    lines.append(f'    <circle cx="{sx}" cy="{sy}" r="{marker_size/2}" fill="{mfc}" stroke="{mec}"/>')
-                elif line.marker == 's':
-                    half = marker_size / 2
-                    lines.append(f'    <rect x="{sx-half}" y="{sy-half}" width="{marker_size}" height="{marker_size}" fill="{mfc}" stroke="{mec}"/>')
-                elif line.marker == '^':
-                    half = marker_size / 2
-                    points = f'{sx},{sy-half} {sx-half},{sy+half} {sx+half},{sy+half}'
-                    lines.append(f'    <polygon points="{points}" fill="{mfc}" stroke="{mec}"/>')
-                elif line.marker in ('+', 'x'):
-                    half = marker_size / 2
-                    if line.marker == '+':
-                        lines.append(f'    <line x1="{sx}" y1="{sy-half}" x2="{sx}" y2="{sy+half}" stroke="{mec}" stroke-width="1.5"/>')
-                        lines.append(f'    <line x1="{sx-half}" y1="{sy}" x2="{sx+half}" y2="{sy}" stroke="{mec}" stroke-width="1.5"/>')
-                    else:
-                        lines.append(f'    <line x1="{sx-half}" y1="{sy-half}" x2="{sx+half}" y2="{sy+half}" stroke="{mec}" stroke-width="1.5"/>')
-                        lines.append(f'    <line x1="{sx-half}" y1="{sy+half}" x2="{sx+half}" y2="{sy-half}" stroke="{mec}" stroke-width="1.5"/>')
-                else:
-                    # Default to small circle
-                    lines.append(f'    <circle cx="{sx}" cy="{sy}" r="{marker_size/3}" fill="{mfc}" stroke="{mec}"/>')
-
-    lines.append('  </g>')
+            mfc = hex_color(line.markerfacecolor)
+            mec = hex_color(line.markeredgecolor)
+
+            marker = line.marker
+            half = marker_size / 2
+
+            if marker == 'o':
+                markers = [f'    <circle cx="{sx}" cy="{sy}" r="{half}" fill="{mfc}" stroke="{mec}"/>\n' for sx, sy in coords]
+            elif marker == 's':
+                markers = [f'    <rect x="{sx-half}" y="{sy-half}" width="{marker_size}" height="{marker_size}" fill="{mfc}" stroke="{mec}"/>\n' for sx, sy in coords]
+            elif marker == '^':
+                markers = [f'    <polygon points="{sx},{sy-half} {sx-half},{sy+half} {sx+half},{sy+half}" fill="{mfc}" stroke="{mec}"/>\n' for sx, sy in coords]
+            elif marker == '+':
+                markers = [f'    <line x1="{sx}" y1="{sy-half}" x2="{sx}" y2="{sy+half}" stroke="{mec}" stroke-width="1.5"/>\n'
+                           f'    <line x1="{sx-half}" y1="{sy}" x2="{sx+half}" y2="{sy}" stroke="{mec}" stroke-width="1.5"/>\n' for sx, sy in coords]
+            elif marker == 'x':
+                markers = [f'    <line x1="{sx-half}" y1="{sy-half}" x2="{sx+half}" y2="{sy+half}" stroke="{mec}" stroke-width="1.5"/>\n'
+                           f'    <line x1="{sx-half}" y1="{sy+half}" x2="{sx+half}" y2="{sy-half}" stroke="{mec}" stroke-width="1.5"/>\n' for sx, sy in coords]
+            else:
+                # Default to small circle
+                r = marker_size / 3
+                markers = [f'    <circle cx="{sx}" cy="{sy}" r="{r}" fill="{mfc}" stroke="{mec}"/>\n' for sx, sy in coords]
+
+            write(''.join(markers))
+
+    write('  </g>\n')
 
     # Axis labels and title
     if ax._xlabel:
         x = ax_left + ax_width / 2
         y = ax_bottom + ax_height + 35
-        lines.append(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="12">{_escape_xml(ax._xlabel)}</text>')
+        write(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="12">{_escape_xml(ax._xlabel)}</text>\n')
 
     if ax._ylabel:
         x = ax_left - 40
         y = ax_bottom + ax_height / 2
-        lines.append(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="12" transform="rotate(-90 {x} {y})">{_escape_xml(ax._ylabel)}</text>')
+        write(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="12" transform="rotate(-90 {x} {y})">{_escape_xml(ax._ylabel)}</text>\n')
 
     if ax._title:
         x = ax_left + ax_width / 2
         y = ax_bottom - 10
-        lines.append(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="12" font-weight="bold">{_escape_xml(ax._title)}</text>')
+        write(f'  <text x="{x}" y="{y}" text-anchor="middle" font-size="12" font-weight="bold">{_escape_xml(ax._title)}</text>\n')
 
     # Tick labels
     xticks = ax._xticks or _auto_ticks(xlim[0], xlim[1])
@@ -218,28 +245,26 @@ def _render_axes_svg(ax, fig, dpi: int) -> list:
         sx, _ = data_to_svg(tick, 0)
         if ax_left <= sx <= ax_left + ax_width:
             label = ax._xticklabels[i] if ax._xticklabels and i < len(ax._xticklabels) else f'{tick:.4g}'
-            lines.append(f'  <text x="{sx}" y="{ax_bottom + ax_height + 15}" text-anchor="middle" font-size="10">{label}</text>')
+            write(f'  <text x="{sx}" y="{ax_bottom + ax_height + 15}" text-anchor="middle" font-size="10">{label}</text>\n')
 
     yticks = ax._yticks or _auto_ticks(ylim[0], ylim[1])
     for i, tick in enumerate(yticks):
         _, sy = data_to_svg(0, tick)
         if ax_bottom <= sy <= ax_bottom + ax_height:
             label = ax._yticklabels[i] if ax._yticklabels and i < len(ax._yticklabels) else f'{tick:.4g}'
-            lines.append(f'  <text x="{ax_left - 5}" y="{sy + 3}" text-anchor="end" font-size="10">{label}</text>')
+            write(f'  <text x="{ax_left - 5}" y="{sy + 3}" text-anchor="end" font-size="10">{label}</text>\n')
 
     # Legend
     if ax._legend:
         legend_x = ax_left + ax_width - 100
         legend_y = ax_bottom + 10
-        lines.append(f'  <rect x="{legend_x}" y="{legend_y}" width="90" height="{len(ax._legend.labels) * 20 + 10}" fill="white" stroke="black" stroke-width="0.5"/>')
+        write(f'  <rect x="{legend_x}" y="{legend_y}" width="90" height="{len(ax._legend.labels) * 20 + 10}" fill="white" stroke="black" stroke-width="0.5"/>\n')
 
         for i, (handle, label) in enumerate(zip(ax._legend.handles, ax._legend.labels)):
             y = legend_y + 15 + i * 20
-            color = to_hex(handle.color) if hasattr(handle, 'color') else '#1f77b4'
-            lines.append(f'  <line x1="{legend_x + 5}" y1="{y}" x2="{legend_x + 25}" y2="{y}" stroke="{color}" stroke-width="2"/>')
-            lines.append(f'  <text x="{legend_x + 30}" y="{y + 4}" font-size="10">{_escape_xml(label)}</text>')
-
-    return lines
+            color = hex_color(handle.color) if hasattr(handle, 'color') else '#1f77b4'
+            write(f'  <line x1="{legend_x + 5}" y1="{y}" x2="{legend_x + 25}" y2="{y}" stroke="{color}" stroke-width="2"/>\n')
+            write(f'  <text x="{legend_x + 30}" y="{y + 4}" font-size="10">{_escape_xml(label)}</text>\n')
 
 
 def _auto_ticks(vmin: float, vmax: float, n: int = 5) -> list:
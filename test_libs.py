@@ -17,6 +17,10 @@ import mymatplotlib
 import mymatplotlib.pyplot as plt
 import mybeautifulsoup
 from mybeautifulsoup import BeautifulSoup, Tag, NavigableString, Comment
+import myfeedparser
+import myfeedparser.parser as feedparser_parser
+import xml.etree.ElementTree as ElementTree
+import io
 import sqlite3
 import tempfile
 import os
@@ -1721,6 +1725,203 @@ def test_beautifulsoup_scraping_patterns():
     return True
 
 
+RSS20_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>RSS Channel</title>
+    <link>http://example.com/</link>
+    <item>
+      <title>First</title>
+      <link>http://example.com/1</link>
+      <dc:creator>Alice</dc:creator>
+      <pubDate>Mon, 06 Sep 2021 16:45:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Second</title>
+      <link>http://example.com/2</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+RDF_FEED = """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/">
+  <channel rdf:about="http://example.com/">
+    <title>RDF Channel</title>
+    <link>http://example.com/</link>
+  </channel>
+  <item rdf:about="http://example.com/1">
+    <title>RDF First</title>
+    <link>http://example.com/1</link>
+  </item>
+  <item rdf:about="http://example.com/2">
+    <title>RDF Second</title>
+    <link>http://example.com/2</link>
+  </item>
+</rdf:RDF>
+"""
+
+ATOM10_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Feed</title>
+  <link href="http://example.com/"/>
+  <updated>2021-09-06T16:45:00Z</updated>
+  <entry>
+    <title>Atom First</title>
+    <link href="http://example.com/1"/>
+    <id>urn:1</id>
+    <author><name>Bob</name></author>
+  </entry>
+  <entry>
+    <title>Atom Second</title>
+    <link href="http://example.com/2"/>
+    <id>urn:2</id>
+  </entry>
+</feed>
+"""
+
+ATOM03_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed version="0.3" xmlns="http://purl.org/atom/ns#">
+  <title>Atom 0.3 Feed</title>
+  <link rel="alternate" type="text/html" href="http://example.com/"/>
+  <entry>
+    <title>Old Atom Entry</title>
+    <link rel="alternate" type="text/html" href="http://example.com/1"/>
+    <id>urn:old:1</id>
+  </entry>
+</feed>
+"""
+
+
+def _feedparser_backends():
+    """Yield the XML backends available to myfeedparser (stdlib always)."""
+    saved = (feedparser_parser.ET, feedparser_parser._HAVE_LXML)
+    try:
+        if saved[1]:
+            yield "lxml"
+        feedparser_parser.ET = ElementTree
+        feedparser_parser._HAVE_LXML = False
+        yield "xml.etree"
+    finally:
+        feedparser_parser.ET, feedparser_parser._HAVE_LXML = saved
+
+
+def test_feedparser_formats():
+    """Test RSS 2.0, RSS 1.0 (RDF), Atom 1.0 and Atom 0.3 parsing"""
+    print("\n" + "=" * 50)
+    print("FEEDPARSER FORMATS")
+    print("=" * 50)
+
+    for backend in _feedparser_backends():
+        print(f"\nBackend: {backend}")
+
+        d = myfeedparser.parse(RSS20_FEED)
+        print(f"  RSS 2.0: {d.version}, {len(d.entries)} entries")
+        assert d.bozo == 0
+        assert d.version == "rss20"
+        assert d.feed.title == "RSS Channel"
+        assert [e.title for e in d.entries] == ["First", "Second"]
+        assert d.entries[0].link == "http://example.com/1"
+        assert d.entries[0].author == "Alice"
+        assert d.entries[0].published_parsed[:3] == (2021, 9, 6)
+
+        d = myfeedparser.parse(RDF_FEED)
+        print(f"  RDF: {d.version}, {len(d.entries)} entries")
+        assert d.bozo == 0
+        assert d.version == "rss10"
+        assert len(d.entries) == 2
+
+        d = myfeedparser.parse(ATOM10_FEED)
+        print(f"  Atom 1.0: {d.version}, {len(d.entries)} entries")
+        assert d.bozo == 0
+        assert d.version == "atom10"
+        assert d.feed.title == "Atom Feed"
+        assert [e.title for e in d.entries] == ["Atom First", "Atom Second"]
+        assert d.entries[0].link == "http://example.com/1"
+        assert d.entries[0].id == "urn:1"
+        assert d.entries[0].author == "Bob"
+
+        d = myfeedparser.parse(ATOM03_FEED)
+        print(f"  Atom 0.3: {d.version}, {len(d.entries)} entries")
+        assert d.bozo == 0
+        assert d.version == "atom03"
+        assert d.feed.title == "Atom 0.3 Feed"
+        assert [e.title for e in d.entries] == ["Old Atom Entry"]
+        assert d.entries[0].link == "http://example.com/1"
+
+    return True
+
+
+def test_feedparser_sources():
+    """Test parsing from str, bytes, file objects and file paths"""
+    print("\n" + "=" * 50)
+    print("FEEDPARSER SOURCES")
+    print("=" * 50)
+
+    with tempfile.NamedTemporaryFile("wb", suffix=".xml", delete=False) as f:
+        f.write(RSS20_FEED.encode("utf-8"))
+        path = f.name
+    try:
+        for backend in _feedparser_backends():
+            sources = {
+                "str": RSS20_FEED,
+                "bytes": RSS20_FEED.encode("utf-8"),
+                "binary file": io.BytesIO(RSS20_FEED.encode("utf-8")),
+                "text file": io.StringIO(RSS20_FEED),
+                "path": path,
+            }
+            for name, source in sources.items():
+                d = myfeedparser.parse(source)
+                print(f"  {backend} / {name}: {len(d.entries)} entries, encoding={d.encoding}")
+                assert d.bozo == 0
+                assert d.version == "rss20"
+                assert [e.title for e in d.entries] == ["First", "Second"]
+    finally:
+        os.unlink(path)
+
+    return True
+
+
+def test_feedparser_malformed():
+    """Test recovery from malformed feeds and nested items"""
+    print("\n" + "=" * 50)
+    print("FEEDPARSER MALFORMED FEEDS")
+    print("=" * 50)
+
+    truncated = RSS20_FEED[:RSS20_FEED.index("<title>Second")]
+    nested = """<rss version="2.0"><channel><title>Nested</title>
+      <item><title>Outer</title><source url="http://example.com/">
+        Origin<item><title>Inner</title></item>
+      </source></item>
+      <item><title>Last</title></item>
+    </channel></rss>"""
+
+    for backend in _feedparser_backends():
+        d = myfeedparser.parse(truncated)
+        print(f"  {backend} / truncated: bozo={d.bozo}, {len(d.entries)} entries")
+        assert d.bozo == 1
+        assert d.bozo_exception is not None
+        assert d.feed.title == "RSS Channel"
+        assert d.entries[0].title == "First"
+
+        d = myfeedparser.parse("<rss><channel><title>x</title>")
+        print(f"  {backend} / unclosed: bozo={d.bozo}, title={d.feed.get('title')}")
+        assert d.bozo == 1
+
+        d = myfeedparser.parse("not a feed at all")
+        print(f"  {backend} / garbage: bozo={d.bozo}")
+        assert d.bozo == 1
+        assert d.entries == []
+
+        # Nested items keep document order
+        d = myfeedparser.parse(nested)
+        print(f"  {backend} / nested: {[e.title for e in d.entries]}")
+        assert d.bozo == 0
+        assert [e.title for e in d.entries] == ["Outer", "Inner", "Last"]
+
+    return True
+
+
 def run_all_tests():
     """Run all tests"""
     tests = [
@@ -1768,6 +1969,9 @@ def run_all_tests():
         ("BeautifulSoup Encoding", test_beautifulsoup_encoding),
         ("BeautifulSoup Comments", test_beautifulsoup_comments),
         ("BeautifulSoup Scraping Patterns", test_beautifulsoup_scraping_patterns),
+        ("Feedparser Formats", test_feedparser_formats),
+        ("Feedparser Sources", test_feedparser_sources),
+        ("Feedparser Malformed", test_feedparser_malformed),
     ]
 
     results = []